@@ -0,0 +1,76 @@
+import asyncio
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter
+
+import structlog
+
+sys.path.append(str(Path.cwd()))
+
+from kedung.client import Client, ClientPool, SyncClient
+from kedung.utils.logging import default_strouctlog_config
+
+REQUESTS = 2000
+DATA_SIZE = 1024
+logger = structlog.get_logger()
+
+
+def measure(name: str, func: Callable[[], None]) -> None:  # noqa: D103
+    time_start = perf_counter()
+    func()
+    execution_time = perf_counter() - time_start
+    logger.info(
+        name,
+        detik=round(execution_time, 3),
+        request_per_detik=int(REQUESTS / execution_time),
+    )
+
+
+def async_client_single_loop() -> None:
+    """Baseline, semua request dikirim dari satu event loop."""
+
+    async def main() -> None:
+        client = Client()
+        await client.create_connection()
+        for number in range(REQUESTS):
+            await client.send("SET", {f"key_{number}": "x" * DATA_SIZE})
+        await client.send("FLUSH")
+
+    asyncio.run(main())
+
+
+def async_client_loop_per_request() -> None:
+    """Cara aplikasi sync menggunakan client async, satu loop per request."""
+
+    async def request(number: int) -> None:
+        pool = ClientPool(size=1)
+        await pool.create_connection()
+        await pool.send("SET", {f"key_{number}": "x" * DATA_SIZE})
+        pool.close_connection()
+
+    for number in range(REQUESTS):
+        asyncio.run(request(number))
+    SyncClient().send("FLUSH")
+
+
+def sync_client() -> None:  # noqa: D103
+    with SyncClient() as client:
+        for number in range(REQUESTS):
+            client.send("SET", {f"key_{number}": "x" * DATA_SIZE})
+        client.send("FLUSH")
+
+
+def sync_client_pipeline() -> None:  # noqa: D103
+    with SyncClient() as client:
+        client.pipeline(
+            [("SET", {f"key_{number}": "x" * DATA_SIZE}) for number in range(REQUESTS)],
+        )
+        client.send("FLUSH")
+
+
+default_strouctlog_config()
+measure("Client, satu event loop", async_client_single_loop)
+measure("Client, event loop per request", async_client_loop_per_request)
+measure("SyncClient", sync_client)
+measure("SyncClient.pipeline", sync_client_pipeline)
@@ -1,4 +1,11 @@
-from .client import Client
+from .client import Client, ClientPool, NearCache, SyncClient, SyncClientPool
 from .server import Server
 
-__all__ = ("Server", "Client")
+__all__ = (
+    "Server",
+    "Client",
+    "ClientPool",
+    "NearCache",
+    "SyncClient",
+    "SyncClientPool",
+)
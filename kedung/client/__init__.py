@@ -1,19 +1,44 @@
 import asyncio
-import json
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
 from pathlib import Path
 from typing import TypeVar, cast
 
 from kedung.client import _helper as helper
+from kedung.client._near_cache import NearCache
 from kedung.client._protocol import ClientBufferedProtocol
+from kedung.client._sync import SyncClient, SyncClientPool
 from kedung.client._tmp_storage import TmpStorage
-from kedung.utils.common_tasks import allocate_data_length
 from kedung.utils.custom_types import Data
-from kedung.utils.exceptions import MissingComponentError
+from kedung.utils.exceptions import CommandError, ConnectionLostError
 from kedung.utils.files import SocketPath
-from kedung.utils.userconf import get_sock_path
+from kedung.utils.userconf import (
+    get_pool_health_check_interval,
+    get_pool_max_in_flight,
+    get_pool_size,
+    get_reconnect_initial_delay,
+    get_reconnect_max_attempts,
+    get_reconnect_max_delay,
+    get_sock_path,
+    get_stream_chunk_size,
+)
 
 T = TypeVar("T", bound="Client")
 
+__all__ = ("Client", "ClientPool", "NearCache", "SyncClient", "SyncClientPool")
+
+# command yg mengubah data, key-nya langsung dihapus dari `NearCache`
+# tanpa menunggu pesan invalidasi dari server.
+_MUTATING_COMMANDS = frozenset({"SET", "DEL", "BSET", "BDEL", "SSET"})
+
+STREAM_CHUNK_SIZE: int = get_stream_chunk_size()
+POOL_SIZE: int = get_pool_size()
+POOL_MAX_IN_FLIGHT: int = get_pool_max_in_flight()
+POOL_HEALTH_CHECK_INTERVAL: float = get_pool_health_check_interval()
+RECONNECT_INITIAL_DELAY: float = get_reconnect_initial_delay()
+RECONNECT_MAX_DELAY: float = get_reconnect_max_delay()
+RECONNECT_MAX_ATTEMPTS: int = get_reconnect_max_attempts()
+
 
 class Client:
     """Utilitas utuk berkomonukasi dengan storage server.
@@ -68,23 +93,76 @@ class Client:
         dalam storage berdasarkan keys yg ada di dalam `data`.
 
     `FLUSH` untuk menghapus semua data yang tersimpan di dalam storage.
+    `STATS` untuk mendapatkan statistik server, seperti jumlah key dan
+        berapa kali backpressure terjadi.
+
+    # Streaming
+    Value string yg sangat besar sebaiknya dikirim dan diterima secara
+    bertahap dengan `stream_set` dan `stream_get` (command `SSET` dan
+    `SGET`), sehingga tidak ada satu frame pun yg melebihi kapasitas
+    prefix dan memory di kedua sisi tetap terbatas.
+
+    # Near cache
+    Dengan `near_cache`, hasil `GET` dan `BGET` disimpan di dalam proses
+    dan server mengirim pesan invalidasi ketika key tsb. berubah, dihapus,
+    kadaluarsa, atau `FLUSH`. Lihat `NearCache`.
+
+    # Koneksi terputus
+    Ketika koneksi ke server terputus, client mencoba terhubung kembali
+    dengan jeda yg terus berlipat. Request baca yg belum dijawab (`GET`,
+    `EXIST`, `BGET`, `BEXISTS`, `SGET`) dikirim ulang, sedangkan request
+    lain gagal dengan `ConnectionLostError` karena belum tentu aman
+    dieksekusi dua kali. Jumlahnya bisa dilihat di `stats`.
     """
 
     _connection_established = False
     _sock_file: Path | None = None
     _transport: asyncio.Transport
-    _protocol: asyncio.Protocol
+    _protocol: ClientBufferedProtocol
+
+    _closing = False
+    _reconnect_task: "asyncio.Task[bool] | None" = None
+    _reconnects = 0
+    _replayed = 0
+    _aborted = 0
 
-    def __init__(self, socket_path: str | None = None) -> None:  # noqa: D107
+    def __init__(  # noqa: D107
+        self,
+        socket_path: str | None = None,
+        near_cache: NearCache | None = None,
+    ) -> None:
         self._tmp_storage = TmpStorage()
         path = socket_path or get_sock_path()
         socket_obj = SocketPath()
         socket_obj.set_path(path)
         self.__class__._sock_file = Path(socket_obj.path_file)  # noqa: SLF001
 
+        self._near_cache = near_cache
+        self._tracked_protocol: ClientBufferedProtocol | None = None
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        """Statistik koneksi client.
+
+        :return: jumlah koneksi yg tersambung kembali (`reconnects`),
+            request yg dikirim ulang (`replayed`) dan request yg
+            digagalkan karena koneksi terputus (`aborted`).
+        :rtype: dict[str, int | float]
+        """
+        return {
+            "reconnects": self._reconnects,
+            "replayed": self._replayed,
+            "aborted": self._aborted,
+        }
+
     @classmethod
     def close_connection(cls) -> None:
         """Menutup koneksi ke server."""
+        cls._closing = True
+        cls._connection_established = False
+        if cls._reconnect_task is not None:
+            cls._reconnect_task.cancel()
+            cls._reconnect_task = None
         cls._transport.close()
 
     @classmethod
@@ -94,13 +172,116 @@ class Client:
         Setidaknya harus dipanggil sekali selama runtime.
         """
         if not cls._connection_established:
-            loop = asyncio.get_running_loop()
-            cls._transport, cls._protocol = await loop.create_unix_connection(
-                protocol_factory=ClientBufferedProtocol,  # type: ignore[arg-type]
-                path=str(cls._sock_file),
-            )
+            cls._closing = False
+            cls._transport, cls._protocol = await cls._open_unix_connection()
             cls._connection_established = True
 
+    @classmethod
+    async def _open_unix_connection(
+        cls,
+    ) -> tuple[asyncio.Transport, ClientBufferedProtocol]:
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.create_unix_connection(
+            protocol_factory=ClientBufferedProtocol,
+            path=str(cls._sock_file),
+        )
+        protocol.lost_handlers.append(cls._on_connection_lost)
+        return transport, protocol
+
+    @classmethod
+    def _on_connection_lost(cls, protocol: ClientBufferedProtocol) -> None:
+        if cls._closing or protocol is not cls._protocol:
+            requests = dict(protocol.in_flight)
+            protocol.in_flight.clear()
+            cls._aborted += cls._fail_requests(requests, "Koneksi ke server ditutup.")
+            return
+
+        cls._reconnect_task = asyncio.get_running_loop().create_task(
+            cls._reconnect(protocol),
+        )
+
+    @classmethod
+    async def _reconnect(cls, protocol: ClientBufferedProtocol) -> bool:
+        replay, aborted = cls._take_replayable(protocol)
+        cls._aborted += aborted
+
+        try:
+            for delay in helper.backoff_delays(
+                RECONNECT_INITIAL_DELAY,
+                RECONNECT_MAX_DELAY,
+                RECONNECT_MAX_ATTEMPTS,
+            ):
+                await asyncio.sleep(delay)
+                try:
+                    transport, new_protocol = await cls._open_unix_connection()
+                except OSError:
+                    continue
+
+                cls._transport, cls._protocol = transport, new_protocol
+                cls._reconnects += 1
+                cls._replayed += len(replay)
+                for unique_key, (command, frame) in replay.items():
+                    new_protocol.in_flight[unique_key] = (command, frame)
+                    transport.write(frame)
+                return True
+        except asyncio.CancelledError:
+            cls._aborted += cls._fail_requests(replay, "Koneksi ke server ditutup.")
+            raise
+
+        cls._connection_established = False
+        cls._aborted += cls._fail_requests(
+            replay,
+            "Gagal terhubung kembali ke server.",
+        )
+        return False
+
+    @staticmethod
+    def _take_replayable(
+        protocol: ClientBufferedProtocol,
+    ) -> tuple[dict[str, tuple[str, bytes]], int]:
+        # request yg aman dikirim ulang dikembalikan, sisanya langsung
+        # digagalkan dan hanya dihitung jumlahnya.
+        replay: dict[str, tuple[str, bytes]] = {}
+        aborted = 0
+        for unique_key, (command, frame) in protocol.in_flight.items():
+            if command in helper.IDEMPOTENT_COMMANDS:
+                replay[unique_key] = (command, frame)
+                continue
+
+            msg = (
+                f"Koneksi terputus sebelum server menjawab `{command}`. "
+                "Request tidak dikirim ulang karena belum tentu aman "
+                "dieksekusi dua kali."
+            )
+            TmpStorage.fail(unique_key, ConnectionLostError(msg))
+            aborted += 1
+
+        protocol.in_flight.clear()
+        return replay, aborted
+
+    @staticmethod
+    def _fail_requests(requests: Iterable[str], reason: str) -> int:
+        count = 0
+        for unique_key in requests:
+            TmpStorage.fail(unique_key, ConnectionLostError(reason))
+            count += 1
+        return count
+
+    @classmethod
+    async def _wait_connection(cls) -> None:
+        # menunggu sampai koneksi tersambung dan buffer tulis tidak penuh.
+        while True:
+            protocol = cls._protocol
+            if protocol.lost:
+                task = cls._reconnect_task
+                if task is None or not await asyncio.shield(task):
+                    msg = "Koneksi ke server terputus."
+                    raise ConnectionLostError(msg)
+            elif protocol.writing_paused:
+                await protocol.wait_writable()
+            else:
+                return
+
     async def send(self, command: str, data: Data | None = None) -> Data:
         """Mengirimkan perintah dan data melalui soket.
 
@@ -117,67 +298,210 @@ class Client:
             server atas permintaan client.
         :rtype: Data
         """
-        if not data and command == "FLUSH":
-            data = {}
-        elif not data and command != "FLUSH":
-            msg = "Kecuali command `FLUSH`, argumen `data` tidak boleh `Falsy`"
-            raise MissingComponentError(msg)
-
-        encoded_data, unique_key = self._pre_processing_data(
-            command.upper(),
-            cast(Data, data),
-        )
+        if self._near_cache is not None:
+            return await self._send_with_near_cache(command, data)
+
+        return await self._send(command, data)
+
+    async def _send(self, command: str, data: Data | None) -> Data:
+        encoded_data, unique_key = self._prepare_request(command, data)
+        await self._wait_connection()
+        self._protocol.in_flight[unique_key] = (command.upper(), encoded_data)
         self._transport.write(encoded_data)
 
-        operation_result: Data
+        return await self._wait_response(unique_key)
+
+    async def _send_with_near_cache(self, command: str, data: Data | None) -> Data:
+        near_cache = cast(NearCache, self._near_cache)
+        command = command.upper()
+        data = helper.validate_data(command, data)
+
+        if command == "FLUSH":
+            near_cache.invalidate_all()
+        elif command in _MUTATING_COMMANDS:
+            near_cache.invalidate(cast(list[str], list(data)))
+
+        if command not in {"GET", "BGET"}:
+            return await self._send(command, data)
+
+        keys = cast(list[str], [key for key in data if key != "injected_data"])
+        cached: Data = {}
+        missing: list[str] = []
+        for key in keys:
+            value, hit = near_cache.get(key)
+            if hit:
+                cached[key] = value
+            else:
+                missing.append(key)
+
+        if not missing:
+            return cached
+
+        await self._ensure_tracking()
+        version = near_cache.begin_read()
+        try:
+            response = await self._send(command, dict.fromkeys(missing))
+        finally:
+            near_cache.end_read()
+
+        if "errors" in response:
+            return response
+
+        for key in missing:
+            near_cache.store(key, response.get(key), version)
+
+        merged = {**cached, **response}
+        return {key: merged.get(key) for key in keys}
+
+    async def _ensure_tracking(self) -> None:
+        # tracking berlaku per koneksi, jadi perlu diaktifkan lagi jika
+        # koneksinya berganti.
+        protocol = self._protocol
+        if self._tracked_protocol is protocol:
+            return
+
+        self._tracked_protocol = protocol
+        protocol.push_handlers.append(self._handle_push)
+        await self._send("TRACKING", {"on": True})
+
+    def _handle_push(self, message: Data) -> None:
+        if self._near_cache is None or message.get("push") != "invalidate":
+            return
+
+        keys = message.get("keys")
+        if keys is None:
+            self._near_cache.invalidate_all()
+        else:
+            self._near_cache.invalidate(cast(list[str], keys))
+
+    async def stream_set(
+        self,
+        key: str,
+        chunks: AsyncIterable[str] | Iterable[str],
+    ) -> bool:
+        """Menyimpan value string secara bertahap, potongan demi potongan.
+
+        Contoh penggunaan:
+        .. highlight:: python
+        .. code-block:: python
+            >>> async def read_file() -> AsyncIterator[str]:
+            ...     with Path("dump.txt").open() as file:
+            ...         while chunk := file.read(1024 * 1024):
+            ...             yield chunk
+            >>>
+            >>> await client.stream_set("key_1", read_file())
+            True
+
+        :param key: kata kunci untuk value yg akan disimpan.
+        :type key: str
+        :param chunks: potongan-potongan value. potongan yg lebih panjang
+            dari `stream_chunk_size` akan dipecah lagi.
+        :type chunks: AsyncIterable[str] | Iterable[str]
+        :raises CommandError: Jika server menolak salah satu potongan.
+        :return: `True` jika value berhasil disimpan, `False` jika key
+            sudah ada dan belum kadaluarsa.
+        :rtype: bool
+        """
+        offset = 0
+        previous: str | None = None
+
+        # potongan ditahan satu langkah agar potongan terakhir bisa
+        # ditandai dengan `end`.
+        async for chunk in helper.split_chunks(chunks, STREAM_CHUNK_SIZE):
+            if previous is not None:
+                if not await self._send_chunk(key, previous, offset, end=False):
+                    return False
+                offset += len(previous)
+            previous = chunk
+
+        return await self._send_chunk(key, previous or "", offset, end=True)
+
+    async def stream_get(
+        self,
+        key: str,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[str]:
+        """Mengambil value string secara bertahap, potongan demi potongan.
+
+        Contoh penggunaan:
+        .. highlight:: python
+        .. code-block:: python
+            >>> with Path("dump.txt").open("w") as file:
+            ...     async for chunk in client.stream_get("key_1"):
+            ...         file.write(chunk)
+
+        :param key: kata kunci untuk value yg akan diambil.
+        :type key: str
+        :param chunk_size: jumlah karakter per potongan.
+        :type chunk_size: int
+        :raises CommandError: Jika value dari `key` bukan string.
+        :return: async iterator berisi potongan value. tidak menghasilkan
+            apapun jika `key` tidak ada.
+        :rtype: AsyncIterator[str]
+        """
+        offset = 0
+
         while True:
-            result, status = self._get_injected_data(unique_key)
-            if status:
-                operation_result = cast(Data, result)
-                break
-            await asyncio.sleep(0.01)
+            result = await self.send(
+                "SGET",
+                {key: {"offset": offset, "size": chunk_size}},
+            )
+            if "errors" in result:
+                raise CommandError(result["errors"])
 
-        return operation_result
+            chunk_info = cast(dict[str, object] | None, result.get(key))
+            if chunk_info is None:
+                return
 
-    def _pre_processing_data(
+            chunk = cast(str, chunk_info["chunk"])
+            if chunk:
+                yield chunk
+            if chunk_info["end"]:
+                return
+            offset += len(chunk)
+
+    async def _send_chunk(
+        self,
+        key: str,
+        chunk: str,
+        offset: int,
+        *,
+        end: bool,
+    ) -> bool:
+        result = await self.send(
+            "SSET",
+            {key: {"chunk": chunk, "offset": offset, "end": end}},
+        )
+        if "errors" in result:
+            raise CommandError(result["errors"])
+
+        return bool(result.get(key))
+
+    def _prepare_request(
         self,
         command: str,
-        data: Data,
+        data: Data | None,
     ) -> tuple[bytes, str]:
-        # membuatkan identitas untuk setiap pemanggilan method `send`.
-        # ketika menggunakan soket, data yang dikirim dan diterima tidak
-        # selalu tersegmentasi dengan benar. ini berarti beberapa pesan
-        # dapat digabungkan menjadi satu atau bisa juga pesan tunggal
-        # dipotong menjadi beberapa bagian, tergantung pada kapan data
-        # diterima oleh protokol. berikut adalah data yg kemungkinan dikirim
-        # dan diterma:
-        # >>> y = b'0018{"key_1":"data_1"}'
-        # >>> x = b'0018{"key_1":"data_1"}0018{"key_2":"data_2"}'
-        #
-        # jadi untuk mengetahui data yg datang itu milik siapa, maka
-        # ditambhakn identitas untuk setiap kali pemnggilan method
-        # `send`. berikut adalah data yg kemungkinan dikirm dan diterima:
-        # >>> y = b'0051{"key_1":"data_1", "injected_data": "SET_79885b2a"}'
-        # >>> x = b'0051{"key_1":"data_1", "injected_data":
-        # "SET_79885b2a"}0051{"key_2":"data_2", , "injected_data": "SET_28e6da17"}'
-        #
-        # dengan begini method bisa memerika apakah data yg mereka
-        # harapakan sudah tersedia atau belum.
-
-        unique_key: str = helper.create_unique_key(command)
-
-        try:
-            injected_data = helper.inject_data(data, unique_key)
-        except TypeError as exc:
-            msg = "Parameter `data` harus dalam bentuk dictionary."
-            raise TypeError(msg) from exc
+        data = helper.validate_data(command, data)
+        return self._pre_processing_data(command.upper(), data)
 
-        injected_data = helper.inject_data(data, unique_key)
-        informations = {"command": command, "data": injected_data}
+    async def _wait_response(self, unique_key: str) -> Data:
+        result, status = self._get_injected_data(unique_key)
+        if status:
+            return cast(Data, result)
 
-        json_data: str = json.dumps(informations)
+        waiter = self._tmp_storage.wait_for(unique_key)
+        try:
+            return await waiter
+        finally:
+            self._tmp_storage.discard(unique_key)
 
-        return (allocate_data_length(json_data), unique_key)
+    def _pre_processing_data(
+        self,
+        command: str,
+        data: Data,
+    ) -> tuple[bytes, str]:
+        return helper.encode_request(command, data)
 
     def _get_injected_data(self, unique_key: str) -> tuple[Data | None, bool]:
         """Mendaptakn data dari `TmpStorage`.
@@ -193,7 +517,295 @@ class Client:
         """
         result = self._tmp_storage.get_data(unique_key)
 
-        if result:
+        if result is not None:
             return result, True
 
         return None, False
+
+
+class _PooledConnection:
+    """Satu koneksi milik `ClientPool` beserta jumlah request aktifnya."""
+
+    def __init__(
+        self,
+        transport: asyncio.Transport,
+        protocol: ClientBufferedProtocol,
+    ) -> None:
+        self.transport = transport
+        self.protocol = protocol
+        self.in_flight = 0
+        self.last_used = time.monotonic()
+        self.reconnecting = False
+
+    @property
+    def is_alive(self) -> bool:
+        return not self.transport.is_closing()
+
+
+class ClientPool(Client):
+    """Kumpulan beberapa koneksi ke storage server.
+
+    `Client` hanya memiliki satu koneksi untuk seluruh proses, sehingga
+    semua coroutine mengantri di socket yg sama. `ClientPool` membuka
+    `size` koneksi dan setiap request dikirim lewat koneksi dengan jumlah
+    request aktif paling sedikit.
+
+    contoh penggunaan:
+    .. highlight:: python
+    .. code-block:: python
+        >>> pool = ClientPool(size=8)
+        >>>
+        >>> async def main() -> None:
+        >>>     await pool.create_connection()
+        >>>     await pool.send("SET", {"key_data_1": "value_data_1"})
+        >>>     pool.stats["in_flight"]
+        >>>     pool.close_connection()
+
+    Command yg dapat digunakan sama dengan `Client`. Ketika semua koneksi
+    sudah memiliki `max_in_flight` request aktif, request berikutnya
+    menunggu dan lama waktu tunggunya dicatat di `stats`.
+
+    Koneksi yg terputus disambung kembali satu per satu seperti `Client`,
+    sementara request baru dikirim lewat koneksi lain yg masih hidup.
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        socket_path: str | None = None,
+        size: int = POOL_SIZE,
+        max_in_flight: int = POOL_MAX_IN_FLIGHT,
+        health_check_interval: float = POOL_HEALTH_CHECK_INTERVAL,
+        near_cache: NearCache | None = None,
+    ) -> None:
+        super().__init__(socket_path, near_cache)
+        self._pool_sock_file = self._sock_file
+        self._size = size
+        self._health_check_interval = health_check_interval
+        self._connections: list[_PooledConnection] = []
+        self._slots = asyncio.Semaphore(size * max_in_flight)
+        self._health_task: asyncio.Task[None] | None = None
+        self._reconnect_tasks: set[asyncio.Task[None]] = set()
+
+        self._requests = 0
+        self._reconnects = 0
+        self._replayed = 0
+        self._aborted = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        """Statistik pemakaian pool.
+
+        :return: jumlah koneksi (`size`, `alive`), request aktif
+            (`in_flight`), total request, jumlah koneksi yg dibuka ulang,
+            request yg dikirim ulang atau digagalkan karena koneksi
+            terputus dan waktu tunggu (detik) untuk mendapatkan koneksi.
+        :rtype: dict[str, int | float]
+        """
+        requests = self._requests
+        return {
+            "size": len(self._connections),
+            "alive": sum(conn.is_alive for conn in self._connections),
+            "in_flight": sum(conn.in_flight for conn in self._connections),
+            "requests": requests,
+            "reconnects": self._reconnects,
+            "replayed": self._replayed,
+            "aborted": self._aborted,
+            "wait_time_total": self._wait_time_total,
+            "wait_time_max": self._wait_time_max,
+            "wait_time_avg": self._wait_time_total / requests if requests else 0.0,
+        }
+
+    async def create_connection(self) -> None:  # type: ignore[override]
+        """Membuka semua koneksi milik pool."""
+        if self._connections:
+            return
+
+        self._connections = list(
+            await asyncio.gather(
+                *(self._open_connection() for _ in range(self._size)),
+            ),
+        )
+        self._health_task = asyncio.create_task(self._health_check())
+
+    def close_connection(self) -> None:  # type: ignore[override]
+        """Menutup semua koneksi milik pool."""
+        if self._health_task:
+            self._health_task.cancel()
+            self._health_task = None
+
+        for task in self._reconnect_tasks:
+            task.cancel()
+
+        for connection in self._connections:
+            connection.transport.close()
+        self._connections = []
+
+    async def _send(self, command: str, data: Data | None) -> Data:
+        # request dikirim lewat koneksi yg paling sedikit bebannya.
+        encoded_data, unique_key = self._prepare_request(command, data)
+        connection = await self._acquire()
+
+        try:
+            if connection.protocol.writing_paused:
+                await connection.protocol.wait_writable()
+            connection.protocol.in_flight[unique_key] = (
+                command.upper(),
+                encoded_data,
+            )
+            connection.transport.write(encoded_data)
+            return await self._wait_response(unique_key)
+        finally:
+            self._release(connection)
+
+    async def _open_connection(self) -> _PooledConnection:
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.create_unix_connection(
+            protocol_factory=ClientBufferedProtocol,
+            path=str(self._pool_sock_file),
+        )
+        connection = _PooledConnection(transport, protocol)
+        protocol.lost_handlers.append(self._on_pooled_connection_lost)
+
+        if self._near_cache is not None:
+            protocol.push_handlers.append(self._handle_push)
+            encoded_data, unique_key = self._prepare_request("TRACKING", {"on": True})
+            protocol.in_flight[unique_key] = ("TRACKING", encoded_data)
+            transport.write(encoded_data)
+            await self._wait_response(unique_key)
+
+        return connection
+
+    def _on_pooled_connection_lost(self, protocol: ClientBufferedProtocol) -> None:
+        connection = next(
+            (conn for conn in self._connections if conn.protocol is protocol),
+            None,
+        )
+        if connection is None:
+            # pool sudah ditutup atau koneksi sudah diganti.
+            requests = dict(protocol.in_flight)
+            protocol.in_flight.clear()
+            self._aborted += self._fail_requests(requests, "Koneksi ke server ditutup.")
+            return
+
+        connection.reconnecting = True
+        task = asyncio.get_running_loop().create_task(
+            self._reconnect_pooled(connection),
+        )
+        self._reconnect_tasks.add(task)
+        task.add_done_callback(self._reconnect_tasks.discard)
+
+    async def _reconnect_pooled(self, connection: _PooledConnection) -> None:
+        replay, aborted = self._take_replayable(connection.protocol)
+        self._aborted += aborted
+
+        try:
+            for delay in helper.backoff_delays(
+                RECONNECT_INITIAL_DELAY,
+                RECONNECT_MAX_DELAY,
+                RECONNECT_MAX_ATTEMPTS,
+            ):
+                await asyncio.sleep(delay)
+                try:
+                    new_connection = await self._open_connection()
+                except OSError:
+                    continue
+
+                if connection not in self._connections:
+                    new_connection.transport.close()
+                    break
+
+                index = self._connections.index(connection)
+                self._connections[index] = new_connection
+                self._reconnects += 1
+                self._replayed += len(replay)
+                for unique_key, (command, frame) in replay.items():
+                    new_connection.protocol.in_flight[unique_key] = (command, frame)
+                    new_connection.transport.write(frame)
+                return
+        except asyncio.CancelledError:
+            self._aborted += self._fail_requests(replay, "Koneksi ke server ditutup.")
+            raise
+        finally:
+            connection.reconnecting = False
+
+        self._aborted += self._fail_requests(
+            replay,
+            "Gagal terhubung kembali ke server.",
+        )
+
+    async def _ensure_tracking(self) -> None:
+        # tracking sudah diaktifkan ketika koneksi dibuka.
+        return
+
+    async def _acquire(self) -> _PooledConnection:
+        started = time.perf_counter()
+        await self._slots.acquire()
+        waited = time.perf_counter() - started
+
+        self._requests += 1
+        self._wait_time_total += waited
+        self._wait_time_max = max(self._wait_time_max, waited)
+
+        while not (alive := [conn for conn in self._connections if conn.is_alive]):
+            if not self._reconnect_tasks:
+                self._slots.release()
+                msg = "Tidak ada koneksi yg tersedia di dalam pool."
+                raise ConnectionError(msg)
+
+            await asyncio.wait(
+                set(self._reconnect_tasks),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+
+        connection = min(alive, key=lambda conn: conn.in_flight)
+        connection.in_flight += 1
+        return connection
+
+    def _release(self, connection: _PooledConnection) -> None:
+        connection.in_flight -= 1
+        connection.last_used = time.monotonic()
+        self._slots.release()
+
+    async def _health_check(self) -> None:
+        while True:
+            await asyncio.sleep(self._health_check_interval)
+            await self._check_idle_connections()
+
+    async def _check_idle_connections(self) -> None:
+        now = time.monotonic()
+
+        for index, connection in enumerate(self._connections):
+            idle = now - connection.last_used >= self._health_check_interval
+            if connection.reconnecting:
+                continue
+            if connection.in_flight or (connection.is_alive and not idle):
+                continue
+
+            if connection.is_alive and await self._ping(connection):
+                continue
+
+            connection.transport.close()
+            try:
+                self._connections[index] = await self._open_connection()
+            except OSError:
+                # server belum bisa dihubungi, dicoba lagi di pengecekan
+                # berikutnya.
+                continue
+            self._reconnects += 1
+
+    async def _ping(self, connection: _PooledConnection) -> bool:
+        encoded_data, unique_key = self._prepare_request("PING", None)
+        connection.transport.write(encoded_data)
+
+        try:
+            result = await asyncio.wait_for(
+                self._wait_response(unique_key),
+                timeout=self._health_check_interval,
+            )
+        except TimeoutError:
+            return False
+
+        connection.last_used = time.monotonic()
+        return bool(result.get("pong"))
@@ -1,9 +1,30 @@
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
 from hashlib import sha256
 from uuid import uuid4
 
+from kedung.utils.common_tasks import allocate_data_length
 from kedung.utils.custom_types import Data
+from kedung.utils.exceptions import MissingComponentError
 
-__all__ = ("create_unique_key", "inject_data")
+__all__ = (
+    "COMMANDS_WITHOUT_DATA",
+    "IDEMPOTENT_COMMANDS",
+    "backoff_delays",
+    "create_unique_key",
+    "encode_request",
+    "inject_data",
+    "split_chunks",
+    "validate_data",
+)
+
+# command yg tidak membutuhkan argumen `data`.
+COMMANDS_WITHOUT_DATA = frozenset({"FLUSH", "STATS", "PING"})
+# command yg aman dikirim ulang setelah koneksi tersambung kembali, karena
+# hasilnya tidak berubah walau server sempat mengeksekusinya.
+IDEMPOTENT_COMMANDS = frozenset(
+    {"GET", "EXIST", "BGET", "BEXISTS", "SGET", "STATS", "PING"},
+)
 
 
 def create_unique_key(command: str) -> str:
@@ -45,3 +66,130 @@ def inject_data(target: Data, injected_data: str) -> Data:
     """
     target["injected_data"] = injected_data
     return target
+
+
+def validate_data(command: str, data: Data | None) -> Data:
+    """Memastikan `data` tersedia untuk `command` yg membutuhkannya.
+
+    :param command: command yg akan dikirim ke server.
+    :type command: str
+    :param data: data yg akan dikirim ke server.
+    :type data: Data | None
+    :raises MissingComponentError: Jika `data` kosong untuk command yg
+        membutuhkan data.
+    :return: `data`, atau dictionary kosong untuk command seperti `FLUSH`.
+    :rtype: Data
+    """
+    if not data and command in COMMANDS_WITHOUT_DATA:
+        return {}
+    if not data:
+        msg = "Kecuali command `FLUSH`, argumen `data` tidak boleh `Falsy`"
+        raise MissingComponentError(msg)
+
+    return data
+
+
+def encode_request(command: str, data: Data) -> tuple[bytes, str]:
+    """Membuat frame request beserta kunci uniknya.
+
+    Contoh penggunaan:
+    .. highlight:: python
+    .. code-block:: python
+        >>> encode_request("GET", {"key_1": None})
+        (b'0000061{"command": "GET", "data": {...}}', "GET_79885b2a")
+
+    :param command: command yg akan dikirim ke server.
+    :type command: str
+    :param data: data yg akan dikirim ke server.
+    :type data: Data
+    :raises TypeError: Jika `data` bukan dictionary.
+    :return: frame yg siap dikirim lewat socket dan kunci uniknya.
+    :rtype: tuple[bytes, str]
+    """
+    # membuatkan identitas untuk setiap pemanggilan method `send`.
+    # ketika menggunakan soket, data yang dikirim dan diterima tidak
+    # selalu tersegmentasi dengan benar. ini berarti beberapa pesan
+    # dapat digabungkan menjadi satu atau bisa juga pesan tunggal
+    # dipotong menjadi beberapa bagian, tergantung pada kapan data
+    # diterima oleh protokol. berikut adalah data yg kemungkinan dikirim
+    # dan diterma:
+    # >>> y = b'0018{"key_1":"data_1"}'
+    # >>> x = b'0018{"key_1":"data_1"}0018{"key_2":"data_2"}'
+    #
+    # jadi untuk mengetahui data yg datang itu milik siapa, maka
+    # ditambhakn identitas untuk setiap kali pemnggilan method
+    # `send`. berikut adalah data yg kemungkinan dikirm dan diterima:
+    # >>> y = b'0051{"key_1":"data_1", "injected_data": "SET_79885b2a"}'
+    # >>> x = b'0051{"key_1":"data_1", "injected_data":
+    # "SET_79885b2a"}0051{"key_2":"data_2", , "injected_data": "SET_28e6da17"}'
+    #
+    # dengan begini method bisa memerika apakah data yg mereka
+    # harapakan sudah tersedia atau belum.
+
+    unique_key: str = create_unique_key(command)
+
+    try:
+        injected_data = inject_data(data, unique_key)
+    except TypeError as exc:
+        msg = "Parameter `data` harus dalam bentuk dictionary."
+        raise TypeError(msg) from exc
+
+    informations = {"command": command, "data": injected_data}
+
+    json_data: str = json.dumps(informations)
+
+    return (allocate_data_length(json_data), unique_key)
+
+
+async def split_chunks(
+    chunks: AsyncIterable[str] | Iterable[str],
+    chunk_size: int,
+) -> AsyncIterator[str]:
+    """Memecah potongan dari `chunks` menjadi maksimal `chunk_size` karakter.
+
+    Contoh penggunaan:
+    .. highlight:: python
+    .. code-block:: python
+        >>> [chunk async for chunk in split_chunks(["abcde", "f"], 2)]
+        ["ab", "cd", "e", "f"]
+
+    :param chunks: sumber potongan data, sync maupun async iterable.
+    :type chunks: AsyncIterable[str] | Iterable[str]
+    :param chunk_size: panjang maksimal setiap potongan.
+    :type chunk_size: int
+    :return: async iterator berisi potongan data.
+    :rtype: AsyncIterator[str]
+    """
+    if isinstance(chunks, AsyncIterable):
+        async for chunk in chunks:
+            for start in range(0, len(chunk), chunk_size):
+                yield chunk[start : start + chunk_size]
+        return
+
+    for chunk in chunks:
+        for start in range(0, len(chunk), chunk_size):
+            yield chunk[start : start + chunk_size]
+
+
+def backoff_delays(initial: float, maximum: float, attempts: int) -> Iterator[float]:
+    """Menghasilkan jeda antar percobaan yg berlipat dua setiap kali.
+
+    Contoh penggunaan:
+    .. highlight:: python
+    .. code-block:: python
+        >>> list(backoff_delays(0.1, 0.5, 5))
+        [0.1, 0.2, 0.4, 0.5, 0.5]
+
+    :param initial: jeda (detik) pertama.
+    :type initial: float
+    :param maximum: jeda (detik) terlama.
+    :type maximum: float
+    :param attempts: jumlah jeda yg dihasilkan.
+    :type attempts: int
+    :return: iterator berisi jeda dalam detik.
+    :rtype: Iterator[float]
+    """
+    delay = initial
+    for _ in range(attempts):
+        yield min(delay, maximum)
+        delay *= 2
@@ -0,0 +1,132 @@
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from kedung.utils.custom_types import DataValue
+from kedung.utils.userconf import get_near_cache_size, get_near_cache_ttl
+
+NEAR_CACHE_SIZE: int = get_near_cache_size()
+NEAR_CACHE_TTL: float = get_near_cache_ttl()
+
+
+class NearCache:
+    """Cache LRU di dalam proses untuk key yg sering dibaca.
+
+    Digunakan oleh `Client` dengan mode tracking aktif. Server mengirim
+    pesan invalidasi ketika key yg pernah dibaca berubah, dihapus,
+    kadaluarsa, atau ketika `FLUSH`, sehingga pembacaan berikutnya cukup
+    diambil dari dictionary tanpa menghubungi server.
+
+    contoh penggunaan:
+    .. highlight:: python
+    .. code-block:: python
+        >>> client = Client(near_cache=NearCache(max_size=10_000, ttl=30))
+        >>> await client.create_connection()
+        >>> await client.send("GET", {"key_1": None})  # dari server
+        >>> await client.send("GET", {"key_1": None})  # dari near cache
+    """
+
+    def __init__(
+        self,
+        max_size: int = NEAR_CACHE_SIZE,
+        ttl: float = NEAR_CACHE_TTL,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, DataValue]] = OrderedDict()
+
+        # versi invalidasi, mencegah jawaban `GET` yg datang setelah
+        # pesan invalidasi menyimpan data yg sudah basi.
+        self._version = 0
+        self._key_versions: dict[str, int] = {}
+        self._flush_version = 0
+        self._reads_in_flight = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self._lookup(key) is not None
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Jumlah entry, hit, miss dan invalidasi."""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+    def get(self, key: str) -> tuple[DataValue, bool]:
+        """Mengambil value dari cache.
+
+        :return: value dan `True` jika ada di cache, `None` dan `False`
+            jika tidak ada atau sudah kadaluarsa.
+        :rtype: tuple[DataValue, bool]
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            self.misses += 1
+            return None, False
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[1], True
+
+    def begin_read(self) -> int:
+        """Menandai awal pembacaan dari server.
+
+        :return: versi yg harus diberikan ke `store`.
+        :rtype: int
+        """
+        self._reads_in_flight += 1
+        return self._version
+
+    def end_read(self) -> None:
+        """Menandai akhir pembacaan dari server."""
+        self._reads_in_flight -= 1
+        if not self._reads_in_flight:
+            self._key_versions.clear()
+
+    def store(self, key: str, value: DataValue, version: int) -> None:
+        """Menyimpan hasil pembacaan yg dimulai pada `version`."""
+        if self._flush_version > version or self._key_versions.get(key, -1) > version:
+            # key berubah ketika jawaban masih dalam perjalanan.
+            return
+
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        """Menghapus `keys` dari cache."""
+        self._version += 1
+        for key in keys:
+            self.invalidations += 1
+            self._entries.pop(key, None)
+            if self._reads_in_flight:
+                self._key_versions[key] = self._version
+
+    def invalidate_all(self) -> None:
+        """Menghapus semua isi cache."""
+        self._version += 1
+        self._flush_version = self._version
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def _lookup(self, key: str) -> tuple[float, DataValue] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        return entry
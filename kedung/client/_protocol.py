@@ -2,11 +2,14 @@ import asyncio
 import json
 from typing import TYPE_CHECKING, cast
 
+from kedung.utils.common_tasks import PUSH_MARKER
 from kedung.utils.unpacking import UnpackRawData
 
 from ._tmp_storage import TmpStorage
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from kedung.utils.custom_types import Data
 
 
@@ -14,24 +17,76 @@ class ClientBufferedProtocol(asyncio.BufferedProtocol):
     def __init__(self) -> None:
         self.buffer = bytearray(512 * 1024)
         self.tmp_storage = TmpStorage()
+        self._unpack_user = f"client_{id(self)}"
+        # ditutup ketika buffer tulis transport melewati high-water mark,
+        # `Client.send` menunggu sampai server kembali membaca.
+        self._writable = asyncio.Event()
+        self._writable.set()
+        # dipanggil untuk setiap pesan yg dikirim server tanpa diminta,
+        # misal invalidasi key untuk `NearCache`.
+        self.push_handlers: list[Callable[[Data], None]] = []
+
+        # request yg sudah dikirim lewat koneksi ini tapi belum dijawab,
+        # berisi nama command dan frame-nya agar bisa dikirim ulang.
+        self.in_flight: dict[str, tuple[str, bytes]] = {}
+        # dipanggil sekali ketika koneksi terputus.
+        self.lost_handlers: list[Callable[[ClientBufferedProtocol], None]] = []
+        self.lost = False
 
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
         self.transport = transport
 
     def connection_lost(self, exc: Exception | None = None) -> None:  # noqa: ARG002
+        UnpackRawData.discard(self._unpack_user)
         self.transport.close()
+        self.lost = True
+        # `send` yg menunggu buffer tulis kosong tidak boleh menunggu
+        # selamanya, dia akan mendapati koneksi sudah terputus.
+        self._writable.set()
+
+        # tracking di server ikut hilang bersama koneksi, semua data yg
+        # pernah dibaca lewat koneksi ini tidak lagi dijamin terbaru.
+        self._dispatch_push({"push": "invalidate", "keys": None})
+
+        for handler in self.lost_handlers:
+            handler(self)
+
+    def pause_writing(self) -> None:
+        self._writable.clear()
+
+    def resume_writing(self) -> None:
+        self._writable.set()
+
+    @property
+    def writing_paused(self) -> bool:
+        """Status apakah penulisan ke server sedang ditahan."""
+        return not self._writable.is_set()
+
+    async def wait_writable(self) -> None:
+        """Menunggu sampai buffer tulis berada di bawah low-water mark."""
+        await self._writable.wait()
 
     def get_buffer(self, sizehint: int) -> bytearray:  # noqa: ARG002
         return self.buffer
 
     def buffer_updated(self, nbytes: int) -> None:
         raw_data: bytearray = self.buffer[:nbytes]
-        for data in UnpackRawData(raw_data, "client"):
+        for data in UnpackRawData(raw_data, self._unpack_user):
             decoded_data = data.decode(encoding="utf-8")
             actual_data: Data = json.loads(decoded_data)
             unique_key: str = cast(str, actual_data.pop("injected_data"))
 
+            if unique_key == PUSH_MARKER:
+                self._dispatch_push(actual_data)
+                continue
+
+            self.in_flight.pop(unique_key, None)
+
             # data yg datang disimpan di `TmpStorage`. jadi method yg
             # berkomunikasi dengan server bisa mengecek apakah jawaban
             # atas permintaan dia sudah tersedia apa belum.
             self.tmp_storage.add_data(unique_key, actual_data)
+
+    def _dispatch_push(self, message: "Data") -> None:
+        for handler in self.push_handlers:
+            handler(message)
@@ -0,0 +1,238 @@
+import json
+import queue
+import socket
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Self, cast
+
+from kedung.client import _helper as helper
+from kedung.utils.common_tasks import PREALLOCATE_SPACE
+from kedung.utils.custom_types import Data
+from kedung.utils.files import SocketPath
+from kedung.utils.userconf import get_pool_size, get_sock_path
+
+POOL_SIZE: int = get_pool_size()
+
+Request = tuple[str, Data | None]
+
+
+class SyncClient:
+    """Client blocking untuk aplikasi yg tidak menggunakan asyncio.
+
+    Menggunakan socket biasa dengan format frame yg sama seperti `Client`,
+    sehingga aplikasi berbasis thread (misal WSGI) tidak perlu membuat
+    event loop hanya untuk mengirim satu request.
+
+    contoh penggunaan:
+    .. highlight:: python
+    .. code-block:: python
+        >>> from kedung.client import SyncClient
+        >>>
+        >>> with SyncClient() as client:
+        ...     client.send("SET", {"key_data_1": "value_data_1"})
+        ...     client.pipeline(
+        ...         [
+        ...             ("GET", {"key_data_1": None}),
+        ...             ("BEXISTS", {"key_data_1": None, "key_data_2": None}),
+        ...         ],
+        ...     )
+
+    Satu instance `SyncClient` tidak thread-safe, gunakan
+    `SyncClientPool` jika koneksi dipakai bersama oleh beberapa thread.
+    """
+
+    def __init__(
+        self,
+        socket_path: str | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        path = socket_path or get_sock_path()
+        socket_obj = SocketPath()
+        socket_obj.set_path(path)
+        self._sock_file = Path(socket_obj.path_file)
+        self._timeout = timeout
+        self._sock: socket.socket | None = None
+        self._reader: BinaryIO | None = None
+
+    def __enter__(self) -> Self:
+        self.connect()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def is_connected(self) -> bool:
+        """Status koneksi ke server."""
+        return self._sock is not None
+
+    def connect(self) -> None:
+        """Membuat koneksi ke server jika belum terhubung."""
+        if self._sock is not None:
+            return
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self._timeout)
+        sock.connect(str(self._sock_file))
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+
+    def close(self) -> None:
+        """Menutup koneksi ke server."""
+        if self._reader is not None:
+            self._reader.close()
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = None
+        self._reader = None
+
+    def send(self, command: str, data: Data | None = None) -> Data:
+        """Mengirimkan satu perintah dan menunggu jawabannya.
+
+        Parameter dan nilai kembaliannya sama dengan `Client.send`.
+        """
+        return self.pipeline([(command, data)])[0]
+
+    def pipeline(self, requests: Iterable[Request]) -> list[Data]:
+        """Mengirimkan beberapa perintah sekaligus dalam satu penulisan.
+
+        :param requests: pasangan command dan data, sama seperti argumen
+            `Client.send`.
+        :type requests: Iterable[tuple[str, Data | None]]
+        :raises ConnectionError: Jika koneksi terputus sebelum semua
+            jawaban diterima.
+        :return: jawaban server dengan urutan yg sama dengan `requests`.
+        :rtype: list[Data]
+        """
+        frames: list[bytes] = []
+        unique_keys: list[str] = []
+        for command, data in requests:
+            checked_data = helper.validate_data(command, data)
+            frame, unique_key = helper.encode_request(command.upper(), checked_data)
+            frames.append(frame)
+            unique_keys.append(unique_key)
+
+        self.connect()
+        sock = cast(socket.socket, self._sock)
+        try:
+            sock.sendall(b"".join(frames))
+            responses = self._read_responses(set(unique_keys))
+        except OSError:
+            # frame yg terpotong tidak bisa dilanjutkan, koneksi harus
+            # dibuat ulang pada pemanggilan berikutnya.
+            self.close()
+            raise
+
+        return [responses[unique_key] for unique_key in unique_keys]
+
+    def _read_responses(self, unique_keys: set[str]) -> dict[str, Data]:
+        responses: dict[str, Data] = {}
+
+        while len(responses) < len(unique_keys):
+            actual_data = self._read_frame()
+            unique_key = cast(str, actual_data.pop("injected_data", None))
+            if unique_key in unique_keys:
+                responses[unique_key] = actual_data
+
+        return responses
+
+    def _read_frame(self) -> Data:
+        prefix = self._read_exactly(PREALLOCATE_SPACE)
+        payload = self._read_exactly(int(prefix))
+        result: Data = json.loads(payload)
+        return result
+
+    def _read_exactly(self, size: int) -> bytes:
+        reader = cast(BinaryIO, self._reader)
+        data = reader.read(size)
+        if len(data) != size:
+            msg = "Koneksi ke server terputus."
+            raise ConnectionError(msg)
+        return data
+
+
+class SyncClientPool:
+    """Kumpulan `SyncClient` yg aman digunakan bersama oleh banyak thread.
+
+    Koneksi dibuat ketika dibutuhkan hingga maksimal `size`. Thread yg
+    tidak kebagian koneksi akan menunggu hingga ada koneksi yg kembali ke
+    pool.
+
+    contoh penggunaan:
+    .. highlight:: python
+    .. code-block:: python
+        >>> pool = SyncClientPool(size=8)
+        >>> pool.send("GET", {"key_data_1": None})
+        >>>
+        >>> with pool.connection() as client:
+        ...     client.pipeline([("GET", {"key_1": None}), ("FLUSH", None)])
+        >>>
+        >>> pool.close()
+    """
+
+    def __init__(
+        self,
+        socket_path: str | None = None,
+        size: int = POOL_SIZE,
+        timeout: float | None = None,
+    ) -> None:
+        self._socket_path = socket_path
+        self._timeout = timeout
+        self._size = size
+        self._created = 0
+        self._lock = threading.Lock()
+        self._idle: queue.LifoQueue[SyncClient] = queue.LifoQueue(maxsize=size)
+
+    @contextmanager
+    def connection(self) -> Iterator[SyncClient]:
+        """Meminjam satu koneksi dari pool."""
+        client = self._acquire()
+        try:
+            yield client
+        finally:
+            self._idle.put(client)
+
+    def send(self, command: str, data: Data | None = None) -> Data:
+        """Sama dengan `SyncClient.send` menggunakan koneksi dari pool."""
+        with self.connection() as client:
+            return client.send(command, data)
+
+    def pipeline(self, requests: Iterable[Request]) -> list[Data]:
+        """Sama dengan `SyncClient.pipeline` menggunakan koneksi dari pool."""
+        with self.connection() as client:
+            return client.pipeline(requests)
+
+    def close(self) -> None:
+        """Menutup semua koneksi yg sedang tidak dipinjam."""
+        while True:
+            try:
+                client = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            client.close()
+            with self._lock:
+                self._created -= 1
+
+    def _acquire(self) -> SyncClient:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self._size
+            if can_create:
+                self._created += 1
+
+        if can_create:
+            return SyncClient(self._socket_path, self._timeout)
+
+        return self._idle.get()
@@ -1,3 +1,4 @@
+import asyncio
 from typing import ClassVar
 
 from kedung.utils.custom_types import Data
@@ -7,6 +8,8 @@ class TmpStorage:
     """Menampung sementara data yg diterima dari server."""
 
     _bucket: ClassVar[dict[str, Data]] = {}
+    # request yg sedang menunggu jawaban, diisi oleh `wait_for`.
+    _waiters: ClassVar[dict[str, asyncio.Future[Data]]] = {}
 
     @classmethod
     def add_data(cls, unique_key: str, value: Data) -> None:
@@ -17,6 +20,11 @@ class TmpStorage:
         :param value: Data yg dikembalikan oleh server.
         :type value: object
         """
+        waiter = cls._waiters.pop(unique_key, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(value)
+            return
+
         cls._bucket[unique_key] = value
 
     @classmethod
@@ -33,3 +41,33 @@ class TmpStorage:
             result = cls._bucket.pop(unique_key)
 
         return result
+
+    @classmethod
+    def wait_for(cls, unique_key: str) -> asyncio.Future[Data]:
+        """Membuat future yg selesai ketika jawaban untuk `unique_key` datang.
+
+        :param unique_key: Kunci unik dari request yg dikirim.
+        :type unique_key: str
+        :return: future berisi data dari server.
+        :rtype: asyncio.Future[Data]
+        """
+        waiter: asyncio.Future[Data] = asyncio.get_running_loop().create_future()
+        result = cls.get_data(unique_key)
+        if result is not None:
+            waiter.set_result(result)
+        else:
+            cls._waiters[unique_key] = waiter
+
+        return waiter
+
+    @classmethod
+    def fail(cls, unique_key: str, exc: BaseException) -> None:
+        """Menggagalkan request `unique_key` yg sedang menunggu jawaban."""
+        waiter = cls._waiters.pop(unique_key, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_exception(exc)
+
+    @classmethod
+    def discard(cls, unique_key: str) -> None:
+        """Berhenti menunggu jawaban untuk `unique_key`."""
+        cls._waiters.pop(unique_key, None)
@@ -1,16 +1,35 @@
-from typing import cast
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, cast
 
 from kedung.utils.custom_types import Data, DataValue
+from kedung.utils.exceptions import CommandError
+from kedung.utils.userconf import get_stream_chunk_size
 
+from ._metrics import ServerMetrics
 from ._storage import DataHolder
+from ._tracking import InvalidationTracker
 from ._types import CommandCall
 
+if TYPE_CHECKING:
+    from ._tracking import InvalidationTarget
+
+STREAM_CHUNK_SIZE: int = get_stream_chunk_size()
+# command yg membaca data, key-nya dicatat ketika mode tracking aktif.
+TRACKED_COMMANDS = frozenset({"GET", "BGET", "EXIST", "BEXISTS", "SGET"})
+
 
 class Command:
     """Utilitas untuk berinteraksi dengan kelas `DataHolder`."""
 
-    def __init__(self) -> None:
+    def __init__(self, connection: "InvalidationTarget | None" = None) -> None:
         self._storage = DataHolder()
+        self._connection = connection
+        self.tracking_enabled = False
+        # potongan value dari `SSET` yg belum selesai dikirim, per key.
+        # `Command` dibuat per koneksi, jadi upload dari koneksi lain
+        # tidak akan tercampur.
+        self._streams: dict[str, list[str]] = {}
+        self._stream_sizes: dict[str, int] = {}
 
     def get_command(self, command: str) -> None | CommandCall:
         list_command: dict[str, CommandCall] = {
@@ -23,6 +42,11 @@ class Command:
             "BDEL": self.bulk_del,
             "BEXISTS": self.bulk_exists,
             "FLUSH": self.flush_,
+            "STATS": self.stats,
+            "PING": self.ping,
+            "TRACKING": self.tracking,
+            "SSET": self.stream_set,
+            "SGET": self.stream_get,
         }
 
         return list_command.get(command)
@@ -129,3 +153,103 @@ class Command:
 
         result = {**operation_result, "injected_data": injected_data}
         return cast(Data, result)
+
+    def stats(self, data: Data) -> Data:
+        actual_data = cast(dict[str, DataValue], data.get("data"))
+        injected_data = cast(str, actual_data.pop("injected_data"))
+        operation_result: dict[str, int] = {
+            **ServerMetrics.snapshot(),
+            "keys": len(self._storage.all_items()),
+        }
+
+        result = {**operation_result, "injected_data": injected_data}
+        return cast(Data, result)
+
+    def ping(self, data: Data) -> Data:
+        actual_data = cast(dict[str, DataValue], data.get("data"))
+        injected_data = cast(str, actual_data.pop("injected_data"))
+
+        result = {"pong": True, "injected_data": injected_data}
+        return cast(Data, result)
+
+    def tracking(self, data: Data) -> Data:
+        _, value, injected_data = self._split_data(data)
+        self.tracking_enabled = bool(value) and self._connection is not None
+
+        if not self.tracking_enabled and self._connection is not None:
+            InvalidationTracker.forget(self._connection)
+
+        result = {"tracking": self.tracking_enabled, "injected_data": injected_data}
+        return cast(Data, result)
+
+    def track_reads(self, command: str, keys: Iterable[str]) -> None:
+        """Mencatat `keys` yg dibaca koneksi ini jika tracking aktif."""
+        if not self.tracking_enabled or command not in TRACKED_COMMANDS:
+            return
+
+        InvalidationTracker.track(keys, cast("InvalidationTarget", self._connection))
+
+    def stream_set(self, data: Data) -> Data:
+        key, value, injected_data = self._split_data(data)
+        chunk_info = cast(dict[str, object], value or {})
+        chunk = cast(str, chunk_info.get("chunk", ""))
+        offset = cast(int, chunk_info.get("offset", 0))
+        operation_result: dict[str, bool]
+
+        if offset == 0:
+            self._discard_stream(key)
+            if self._storage.contains(key):
+                # sama seperti `SET`, data yg belum kadaluarsa tidak
+                # ditimpa. ditolak di awal agar client tidak perlu
+                # mengirim semua potongan.
+                result = {key: False, "injected_data": injected_data}
+                return cast(Data, result)
+            self._streams[key] = []
+            self._stream_sizes[key] = 0
+
+        if self._stream_sizes.get(key) != offset:
+            self._discard_stream(key)
+            error_msg = [f"Offset `{offset}` untuk key `{key}` tidak sesuai!"]
+            raise CommandError({"errors": error_msg, "injected_data": injected_data})
+
+        self._streams[key].append(chunk)
+        self._stream_sizes[key] += len(chunk)
+
+        if chunk_info.get("end"):
+            full_value = "".join(self._streams[key])
+            self._discard_stream(key)
+            operation_result = self._storage.set_(key, full_value)
+        else:
+            operation_result = {key: True}
+
+        result = {**operation_result, "injected_data": injected_data}
+        return cast(Data, result)
+
+    def stream_get(self, data: Data) -> Data:
+        key, value, injected_data = self._split_data(data)
+        chunk_info = cast(dict[str, int], value or {})
+        offset = chunk_info.get("offset", 0)
+        size = min(chunk_info.get("size", STREAM_CHUNK_SIZE), STREAM_CHUNK_SIZE)
+
+        stored = self._storage.get(key).get(key)
+        if stored is None:
+            result = {key: None, "injected_data": injected_data}
+            return cast(Data, result)
+
+        if not isinstance(stored, str):
+            error_msg = [f"Value dari key `{key}` bukan string!"]
+            raise CommandError({"errors": error_msg, "injected_data": injected_data})
+
+        operation_result: dict[str, dict[str, object]] = {
+            key: {
+                "chunk": stored[offset : offset + size],
+                "end": offset + size >= len(stored),
+                "length": len(stored),
+            },
+        }
+
+        return cast(Data, {**operation_result, "injected_data": injected_data})
+
+    def _discard_stream(self, key: str) -> None:
+        self._streams.pop(key, None)
+        self._stream_sizes.pop(key, None)
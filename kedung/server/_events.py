@@ -0,0 +1,37 @@
+from collections.abc import Callable
+from typing import ClassVar
+
+# dipanggil dengan nama event dan key yg berubah. untuk event `flush`,
+# key berisi string kosong.
+Listener = Callable[[str, str], None]
+
+
+class KeyspaceEvents:
+    """Penyalur event perubahan data di dalam `DataHolder`.
+
+    Event yg dikirim diantaranya,
+    `set` ketika data baru disimpan.
+    `del` ketika data dihapus oleh client.
+    `expired` ketika data dihapus karena kadaluarsa.
+    `flush` ketika semua data dihapus.
+    """
+
+    _listeners: ClassVar[list[Listener]] = []
+
+    @classmethod
+    def subscribe(cls, listener: Listener) -> None:
+        """Mendaftarkan `listener` untuk menerima semua event."""
+        if listener not in cls._listeners:
+            cls._listeners.append(listener)
+
+    @classmethod
+    def unsubscribe(cls, listener: Listener) -> None:
+        """Berhenti mengirim event ke `listener`."""
+        if listener in cls._listeners:
+            cls._listeners.remove(listener)
+
+    @classmethod
+    def emit(cls, event: str, key: str = "") -> None:
+        """Mengirim `event` untuk `key` ke semua listener."""
+        for listener in cls._listeners:
+            listener(event, key)
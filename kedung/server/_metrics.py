@@ -0,0 +1,31 @@
+from typing import ClassVar
+
+
+class ServerMetrics:
+    """Penghitung sederhana untuk memantau kondisi server.
+
+    Seperti `DataHolder`, nilainya disimpan di level kelas sehingga
+    bisa diakses dari protocol manapun dan dibaca lewat command `STATS`.
+    """
+
+    _counters: ClassVar[dict[str, int]] = {}
+
+    @classmethod
+    def increment(cls, name: str, value: int = 1) -> None:
+        """Menambahkan `value` ke penghitung `name`."""
+        cls._counters[name] = cls._counters.get(name, 0) + value
+
+    @classmethod
+    def get(cls, name: str) -> int:
+        """Mengembalikan nilai penghitung `name`."""
+        return cls._counters.get(name, 0)
+
+    @classmethod
+    def snapshot(cls) -> dict[str, int]:
+        """Mengembalikan salinan semua penghitung."""
+        return dict(cls._counters)
+
+    @classmethod
+    def reset(cls) -> None:
+        """Mengosongkan semua penghitung."""
+        cls._counters.clear()
@@ -1,27 +1,57 @@
 import asyncio
-from collections.abc import MutableMapping
+from collections.abc import Iterable, MutableMapping
 from typing import TYPE_CHECKING, cast
 
 import structlog
 
-from kedung.utils.common_tasks import allocate_data_length
-from kedung.utils.custom_types import Data
-from kedung.utils.exceptions import CommandError, MissingComponentError
+from kedung.utils.common_tasks import PUSH_MARKER, allocate_data_length
+from kedung.utils.custom_types import Data, DataValue
+from kedung.utils.exceptions import CommandError, MissingComponentError, PrefixError
 from kedung.utils.unpacking import UnpackRawData
+from kedung.utils.userconf import (
+    get_output_buffer_limit,
+    get_write_batch_bytes,
+    get_write_batch_size,
+    get_write_coalescing,
+    get_write_high_water,
+    get_write_low_water,
+)
 
 from ._commands import Command
+from ._metrics import ServerMetrics
 from ._serdes import deserializer, serilizer
+from ._tracking import InvalidationTracker
 
 if TYPE_CHECKING:
     from ._types import CommandCall
 
 logger = structlog.get_logger()
 
+WRITE_BATCH_SIZE: int = get_write_batch_size()
+WRITE_BATCH_BYTES: int = get_write_batch_bytes()
+WRITE_COALESCING: str = get_write_coalescing()
+WRITE_HIGH_WATER: int = get_write_high_water()
+WRITE_LOW_WATER: int = get_write_low_water()
+OUTPUT_BUFFER_LIMIT: int = get_output_buffer_limit()
+
 
 class ServerBufferedProtocol(asyncio.BufferedProtocol):
     def __init__(self) -> None:
         self.buffer = bytearray(512 * 1024)
-        self.command = Command()
+        self.command = Command(self)
+        self._unpack_user = f"server_{id(self)}"
+        # respons yg belum dikirim ke client. dikirim sekaligus dengan
+        # `transport.writelines` agar ratusan request yg datang dalam
+        # satu waktu tidak menghasilkan ratusan pemanggilan `write`.
+        self._pending_responses: list[bytes] = []
+        self._pending_bytes = 0
+        self._flush_scheduled = False
+        self._writing_paused = False
+        # key yg perlu diinvalidasi di client, dikirim dalam satu pesan
+        # per iterasi event loop.
+        self._invalidated_keys: set[str] = set()
+        self._invalidate_all = False
+        self._invalidation_scheduled = False
         super().__init__()
 
     def connection_made(
@@ -29,27 +59,171 @@ class ServerBufferedProtocol(asyncio.BufferedProtocol):
         transport: asyncio.Transport,  # type: ignore[override]
     ) -> None:
         self.transport = transport
+        self.transport.set_write_buffer_limits(
+            high=WRITE_HIGH_WATER,
+            low=WRITE_LOW_WATER,
+        )
         logger.info("Koneksi dibuat!")
 
     def connection_lost(self, exc: Exception | None = None) -> None:  # noqa: ARG002
+        self._pending_responses.clear()
+        self._pending_bytes = 0
+        if self._writing_paused:
+            self._writing_paused = False
+            ServerMetrics.increment("paused_connections", -1)
+        UnpackRawData.discard(self._unpack_user)
+        InvalidationTracker.forget(self)
         self.transport.close()
         logger.info("Koneksi terputus!")
 
+    def pause_writing(self) -> None:
+        # client mengirim request lebih cepat dari kemampuannya membaca
+        # respons. berhenti membaca request baru sampai buffer tulis
+        # kembali di bawah `WRITE_LOW_WATER`.
+        self._writing_paused = True
+        self.transport.pause_reading()
+        ServerMetrics.increment("write_paused")
+        ServerMetrics.increment("paused_connections")
+        logger.debug("Buffer tulis penuh, pembacaan dihentikan sementara.")
+
+    def resume_writing(self) -> None:
+        self._writing_paused = False
+        self.transport.resume_reading()
+        ServerMetrics.increment("write_resumed")
+        ServerMetrics.increment("paused_connections", -1)
+        logger.debug("Buffer tulis kosong, pembacaan dilanjutkan.")
+
     def get_buffer(self, sizehint: int) -> bytearray:  # noqa: ARG002
         return self.buffer
 
     def buffer_updated(self, nbytes: int) -> None:
         raw_data: bytearray = self.buffer[:nbytes]
 
-        for data in UnpackRawData(raw_data, "server"):
+        for data in UnpackRawData(raw_data, self._unpack_user):
             result: Data = deserializer(data)
+            injected_data = cast(
+                DataValue,
+                cast(Data, result.get("data", {})).get("injected_data"),
+            )
             try:
                 response: str = self._process_command(result)
             except (MissingComponentError, CommandError) as exc:
                 response = serilizer(exc.args[0])
             finally:
-                mapped_data: bytes = allocate_data_length(response)
-                self.transport.write(mapped_data)
+                mapped_data: bytes = self._frame_response(response, injected_data)
+                self._queue_response(mapped_data)
+
+        if WRITE_COALESCING == "loop":
+            self._schedule_flush()
+        else:
+            self.flush_responses()
+
+    def flush_responses(self) -> None:
+        """Mengirim semua respons yg tertahan dalam satu kali penulisan."""
+        self._flush_scheduled = False
+        if not self._pending_responses:
+            return
+
+        responses = self._pending_responses
+        self._pending_responses = []
+        self._pending_bytes = 0
+        self.transport.writelines(responses)
+
+        if self._writing_paused:
+            self._enforce_output_limit()
+
+    def _enforce_output_limit(self) -> None:
+        buffer_size = self.transport.get_write_buffer_size()
+        if buffer_size <= OUTPUT_BUFFER_LIMIT:
+            return
+
+        ServerMetrics.increment("output_limit_disconnects")
+        logger.warning(
+            "Buffer tulis melebihi batas, koneksi diputus.",
+            buffer_size=buffer_size,
+            limit=OUTPUT_BUFFER_LIMIT,
+        )
+        self.transport.abort()
+
+    def _frame_response(self, response: str, injected_data: DataValue) -> bytes:
+        try:
+            return allocate_data_length(response)
+        except PrefixError as exc:
+            # respons terlalu besar untuk prefix, misal `BGET` dengan
+            # value yg sangat besar. client diarahkan ke `SGET`.
+            error: Data = {"errors": [exc.args[0]], "injected_data": injected_data}
+            return allocate_data_length(serilizer(error))
+
+    def _queue_response(self, response: bytes) -> None:
+        self._pending_responses.append(response)
+        self._pending_bytes += len(response)
+
+        # batas atas penggabungan, agar respons pertama tidak tertahan
+        # terlalu lama ketika request yg datang sangat banyak.
+        if (
+            len(self._pending_responses) >= WRITE_BATCH_SIZE
+            or self._pending_bytes >= WRITE_BATCH_BYTES
+        ):
+            self.flush_responses()
+
+    def _schedule_flush(self) -> None:
+        # respons dari beberapa `buffer_updated` dalam satu iterasi
+        # event loop dikirim bersamaan di iterasi berikutnya.
+        if self._flush_scheduled or not self._pending_responses:
+            return
+
+        self._flush_scheduled = True
+        asyncio.get_running_loop().call_soon(self.flush_responses)
+
+    def push(self, message: Data) -> None:
+        """Mengirim pesan ke client tanpa diminta, misal invalidasi key."""
+        frame = allocate_data_length(
+            serilizer({**message, "injected_data": PUSH_MARKER}),
+        )
+        self._queue_response(frame)
+
+        try:
+            self._schedule_flush()
+        except RuntimeError:
+            # dipanggil di luar event loop.
+            self.flush_responses()
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        """Menjadwalkan pesan invalidasi untuk `keys`."""
+        self._invalidated_keys.update(keys)
+        self._schedule_invalidation()
+
+    def invalidate_all(self) -> None:
+        """Menjadwalkan pesan invalidasi untuk semua key."""
+        self._invalidate_all = True
+        self._schedule_invalidation()
+
+    def _schedule_invalidation(self) -> None:
+        if self._invalidation_scheduled:
+            return
+
+        self._invalidation_scheduled = True
+        try:
+            asyncio.get_running_loop().call_soon(self._send_invalidations)
+        except RuntimeError:
+            # dipanggil di luar event loop.
+            self._send_invalidations()
+
+    def _send_invalidations(self) -> None:
+        self._invalidation_scheduled = False
+        if self.transport.is_closing():
+            return
+
+        if self._invalidate_all:
+            message: Data = {"push": "invalidate", "keys": None}
+        elif self._invalidated_keys:
+            message = {"push": "invalidate", "keys": sorted(self._invalidated_keys)}
+        else:
+            return
+
+        self._invalidated_keys.clear()
+        self._invalidate_all = False
+        self.push(message)
 
     def _process_command(self, user_data: Data) -> str:
         error_msg: list[str]
@@ -76,5 +250,7 @@ class ServerBufferedProtocol(asyncio.BufferedProtocol):
             result = {"errors": error_msg, "injected_data": injected_data}
             raise CommandError(result)
 
+        keys = [key for key in data_value if key != "injected_data"]
         result = command_call(user_data)
+        self.command.track_reads(command, cast(list[str], keys))
         return serilizer(result)
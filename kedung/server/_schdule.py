@@ -33,7 +33,7 @@ async def _remove_expired_items() -> None:
     try:
         for key, value in all_items.items():
             if _is_expired(value):
-                storage.clear(key)
+                storage.expire(key)
     except RuntimeError as RE:
         msg = RE.args[0]
         if "dictionary changed" in msg:
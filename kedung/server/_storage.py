@@ -5,6 +5,8 @@ from kedung.utils.custom_types import Storage
 from kedung.utils.dateandtime import get_localzone
 from kedung.utils.userconf import get_cache_duration
 
+from ._events import KeyspaceEvents
+
 if TYPE_CHECKING:
     from collections.abc import MutableMapping
 
@@ -23,12 +25,23 @@ class DataHolder:
             return False
 
         cls._storage.pop(key)
+        KeyspaceEvents.emit("del", key)
+        return True
+
+    @classmethod
+    def expire(cls, key: str) -> bool:
+        """Menghapus data yg sudah kadaluarsa berdasarkan `key`."""
+        if cls._storage.pop(key, None) is None:
+            return False
+
+        KeyspaceEvents.emit("expired", key)
         return True
 
     @classmethod
     def clear_all(cls) -> bool:
         """Menghapus semua data yg disimpan sementara di dalam memory."""
         cls._storage.clear()
+        KeyspaceEvents.emit("flush")
         return bool(not cls._storage)
 
     @classmethod
@@ -71,9 +84,15 @@ class DataHolder:
             "expired": expired,
             "data": value,
         }
+        KeyspaceEvents.emit("set", key)
 
         return {key: True}
 
+    @classmethod
+    def contains(cls, key: str) -> bool:
+        """Status keberadaan data yg belum kadaluarsa berdasarkan `key`."""
+        return key in cls._storage and not cls._is_data_expired(key)
+
     @classmethod
     def all_items(cls) -> Storage:
         """Mengembalikan semuat item yg tersimpan di _storage."""
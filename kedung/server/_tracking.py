@@ -0,0 +1,72 @@
+from collections.abc import Iterable
+from typing import ClassVar, Protocol
+
+from ._events import KeyspaceEvents
+
+
+class InvalidationTarget(Protocol):
+    """Koneksi yg bisa menerima pesan invalidasi dari server."""
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        """Memberi tahu client bahwa `keys` sudah berubah."""
+
+    def invalidate_all(self) -> None:
+        """Memberi tahu client bahwa semua data sudah dihapus."""
+
+
+class InvalidationTracker:
+    """Mencatat key yg sudah dibaca oleh koneksi dengan mode tracking.
+
+    Ketika key tsb. berubah, dihapus, atau kadaluarsa, koneksi yg pernah
+    membacanya akan menerima pesan invalidasi sekali, lalu catatannya
+    dihapus. Client harus membaca ulang key tsb. agar dicatat kembali.
+    """
+
+    _readers: ClassVar[dict[str, set[InvalidationTarget]]] = {}
+    _keys: ClassVar[dict[InvalidationTarget, set[str]]] = {}
+
+    @classmethod
+    def track(cls, keys: Iterable[str], target: InvalidationTarget) -> None:
+        """Mencatat bahwa `target` menyimpan salinan dari `keys`."""
+        tracked_keys = cls._keys.setdefault(target, set())
+        for key in keys:
+            cls._readers.setdefault(key, set()).add(target)
+            tracked_keys.add(key)
+
+    @classmethod
+    def forget(cls, target: InvalidationTarget) -> None:
+        """Menghapus semua catatan milik `target`, misal koneksi terputus."""
+        for key in cls._keys.pop(target, set()):
+            readers = cls._readers.get(key)
+            if readers is None:
+                continue
+            readers.discard(target)
+            if not readers:
+                del cls._readers[key]
+
+    @classmethod
+    def tracked_keys(cls, target: InvalidationTarget) -> set[str]:
+        """Mengembalikan key yg sedang dicatat untuk `target`."""
+        return set(cls._keys.get(target, set()))
+
+    @classmethod
+    def on_event(cls, event: str, key: str) -> None:
+        """Listener untuk `KeyspaceEvents`."""
+        if event == "flush":
+            targets = list(cls._keys)
+            cls._readers.clear()
+            cls._keys.clear()
+            for target in targets:
+                target.invalidate_all()
+            return
+
+        readers = cls._readers.pop(key, None)
+        if not readers:
+            return
+
+        for target in readers:
+            cls._keys.get(target, set()).discard(key)
+            target.invalidate((key,))
+
+
+KeyspaceEvents.subscribe(InvalidationTracker.on_event)
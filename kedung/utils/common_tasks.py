@@ -1,6 +1,11 @@
+from kedung.utils.exceptions import PrefixError
 from kedung.utils.userconf import get_preallocate_space
 
 PREALLOCATE_SPACE: int = get_preallocate_space()
+# nilai `injected_data` untuk pesan yg dikirim server tanpa diminta
+# client, misal invalidasi key. tidak akan bentrok dengan kunci unik
+# dari client yg berformat `<command>_<8 karakter>`.
+PUSH_MARKER = "PUSH"
 
 
 def allocate_data_length(data: str) -> bytes:
@@ -12,6 +17,7 @@ def allocate_data_length(data: str) -> bytes:
     :return: Data JSON yang sudah dilengkapi dengan panjangnya dan dikonversi
         menjadi bytes.
     :rtype: bytes
+    :raises PrefixError: Jika panjang data tidak muat di dalam prefix.
 
     **Contoh Penggunaan**:
     .. highlight:: python
@@ -22,5 +28,12 @@ def allocate_data_length(data: str) -> bytes:
     """
     length_data = len(data)
     max_length_digits = PREALLOCATE_SPACE
+    if length_data >= 10**max_length_digits:
+        msg = (
+            f"Panjang data ({length_data}) melebihi kapasitas prefix "
+            f"{max_length_digits} digit."
+        )
+        raise PrefixError(msg)
+
     result = str(length_data).zfill(max_length_digits)
     return f"{result}{data}".encode()
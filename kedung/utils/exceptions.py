@@ -8,3 +8,7 @@ class CommandError(Exception):
 
 class MissingComponentError(Exception):
     """Dinaikan ketika atribute yg dibutuhkan suatu method tidak ditemukan."""
+
+
+class ConnectionLostError(ConnectionError):
+    """Dinaikan ketika koneksi terputus sebelum jawaban dari server diterima."""
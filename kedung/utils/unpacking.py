@@ -28,6 +28,9 @@ class UnpackRawData:
         ...     result.get("key_2") == "data_2"
     """
 
+    # menampung broken data per `user`. setiap koneksi sebaiknya
+    # menggunakan `user` yg berbeda, misal `server_<id protocol>`, karena
+    # data yg terpotong dari dua koneksi tidak boleh digabung.
     _broken_data: ClassVar[dict[str, bytes]] = {
         "client": b"",  # menampung broken data untuk client.
         "server": b"",  # menampung broken data untuk server.
@@ -103,6 +106,15 @@ class UnpackRawData:
 
             self._remaining_data = remaining_data
 
+    @classmethod
+    def discard(cls, user: str) -> None:
+        """Membuang sisa data yg belum komplet milik `user`.
+
+        Dipanggil ketika koneksi terputus agar sisa data tidak tercampur
+        dengan koneksi lain dan tidak menumpuk di memory.
+        """
+        cls._broken_data.pop(user, None)
+
     def _convert_into_int(self, prefix: bytes) -> bytes:
         """Mengembalikan string angka tanpa angka 0 disebalah kiri."""
         index = 0
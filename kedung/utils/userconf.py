@@ -120,3 +120,98 @@ def get_cache_duration() -> int:
         if isinstance(duration, int)
         else cast(int, duration.get("cache_duration", default_space))
     )
+
+
+def _runtime_option(
+    name: str,
+    default: int | float | str | bool,
+) -> int | float | str | bool:
+    """Mengambil opsi `name` dari tabel `[kedung.runtime]`."""
+    read_file = _user_conf()
+
+    if not read_file:
+        return default
+
+    runtime = cast(
+        int | float | str | bool | dict[str, int | float | str | bool],
+        read_file.get("runtime", default),
+    )
+    if not isinstance(runtime, dict):
+        return default
+
+    return runtime.get(name, default)
+
+
+def get_write_batch_size() -> int:
+    """Menyediakan jumlah maksimal respons yg ditahan sebelum dikirim."""
+    return cast(int, _runtime_option("write_batch_size", 128))
+
+
+def get_write_batch_bytes() -> int:
+    """Menyediakan jumlah maksimal bytes respons yg ditahan sebelum dikirim."""
+    return cast(int, _runtime_option("write_batch_bytes", 256 * 1024))
+
+
+def get_write_coalescing() -> str:
+    """Menyediakan cakupan penggabungan respons, `buffer` atau `loop`."""
+    return cast(str, _runtime_option("write_coalescing", "buffer"))
+
+
+def get_write_high_water() -> int:
+    """Menyediakan batas atas buffer tulis sebelum pembacaan dihentikan."""
+    return cast(int, _runtime_option("write_high_water", 1024 * 1024))
+
+
+def get_write_low_water() -> int:
+    """Menyediakan batas bawah buffer tulis untuk melanjutkan pembacaan."""
+    return cast(int, _runtime_option("write_low_water", 256 * 1024))
+
+
+def get_output_buffer_limit() -> int:
+    """Menyediakan batas buffer tulis per koneksi sebelum koneksi diputus."""
+    return cast(int, _runtime_option("output_buffer_limit", 64 * 1024 * 1024))
+
+
+def get_stream_chunk_size() -> int:
+    """Menyediakan jumlah karakter per potongan pada command streaming."""
+    return cast(int, _runtime_option("stream_chunk_size", 256 * 1024))
+
+
+def get_pool_size() -> int:
+    """Menyediakan jumlah koneksi yg dibuka oleh `ClientPool`."""
+    return cast(int, _runtime_option("pool_size", 4))
+
+
+def get_pool_max_in_flight() -> int:
+    """Menyediakan jumlah maksimal request yg menunggu jawaban per koneksi."""
+    return cast(int, _runtime_option("pool_max_in_flight", 256))
+
+
+def get_pool_health_check_interval() -> float:
+    """Menyediakan jeda (detik) pengecekan koneksi yg menganggur."""
+    return cast(float, _runtime_option("pool_health_check_interval", 30))
+
+
+def get_near_cache_size() -> int:
+    """Menyediakan jumlah maksimal key yg disimpan `NearCache`."""
+    return cast(int, _runtime_option("near_cache_size", 10_000))
+
+
+def get_near_cache_ttl() -> float:
+    """Menyediakan durasi (detik) sebuah key disimpan `NearCache`."""
+    return cast(float, _runtime_option("near_cache_ttl", 60))
+
+
+def get_reconnect_initial_delay() -> float:
+    """Menyediakan jeda (detik) awal sebelum client mencoba terhubung lagi."""
+    return cast(float, _runtime_option("reconnect_initial_delay", 0.1))
+
+
+def get_reconnect_max_delay() -> float:
+    """Menyediakan jeda (detik) maksimal antar percobaan terhubung lagi."""
+    return cast(float, _runtime_option("reconnect_max_delay", 5))
+
+
+def get_reconnect_max_attempts() -> int:
+    """Menyediakan jumlah percobaan terhubung lagi sebelum client menyerah."""
+    return cast(int, _runtime_option("reconnect_max_attempts", 10))
@@ -1,9 +1,10 @@
 """Mengkover test yg belum atau tidak terkover di modul lain."""
 
+from collections.abc import AsyncIterator
 from typing import cast
 
 import pytest
-from kedung.client._helper import create_unique_key, inject_data
+from kedung.client._helper import create_unique_key, inject_data, split_chunks
 from kedung.client._tmp_storage import TmpStorage
 from kedung.utils.custom_types import Data
 
@@ -54,3 +55,21 @@ def test_crete_unique_key() -> None:
 
     assert len(result) == result_length
     assert command in result
+
+
+@pytest.mark.asyncio
+async def test_split_chunks_from_iterable() -> None:
+    result = [chunk async for chunk in split_chunks(["abcde", "f"], 2)]
+
+    assert result == ["ab", "cd", "e", "f"]
+
+
+@pytest.mark.asyncio
+async def test_split_chunks_from_async_iterable() -> None:
+    async def source() -> AsyncIterator[str]:
+        yield "abc"
+        yield "de"
+
+    result = [chunk async for chunk in split_chunks(source(), 2)]
+
+    assert result == ["ab", "c", "de"]
@@ -4,8 +4,9 @@ from unittest.mock import AsyncMock
 
 import pytest
 from kedung.client import Client
+from kedung.client._protocol import ClientBufferedProtocol
 from kedung.utils.custom_types import Data
-from kedung.utils.exceptions import MissingComponentError
+from kedung.utils.exceptions import CommandError, MissingComponentError
 from pytest_mock.plugin import MockerFixture
 
 
@@ -26,7 +27,7 @@ async def test_create_connection(
 ) -> None:
     loop = asyncio.get_running_loop()
     mock_transport = mocker.Mock(spec=asyncio.Transport)
-    mock_protocol = mocker.Mock(spec=asyncio.Protocol)
+    mock_protocol = ClientBufferedProtocol()
 
     mocker.patch.object(
         loop,
@@ -45,7 +46,7 @@ async def test_close_connection(
 ) -> None:
     loop = asyncio.get_running_loop()
     mock_transport = mocker.Mock(spec=asyncio.Transport)
-    mock_protocol = mocker.Mock(spec=asyncio.Protocol)
+    mock_protocol = ClientBufferedProtocol()
 
     # Mock metode create_unix_connection untuk mengembalikan mock transport dan protocol
     mocker.patch.object(
@@ -143,6 +144,33 @@ async def test_send(
     assert result.get("key_1")
 
 
+@pytest.mark.asyncio
+async def test_send_waits_while_writing_paused(
+    mocker: MockerFixture,
+    client: Client,
+    dummy_data: tuple[str, dict[str, str]],
+) -> None:
+    mock_write = mocker.patch.object(client._transport, "write")
+    mocker.patch.object(
+        client,
+        "_get_injected_data",
+        return_value=({"key_1": True}, True),
+    )
+    client._protocol.pause_writing()
+
+    task = asyncio.create_task(
+        client.send(command=dummy_data[0], data=cast(Data, dummy_data[1])),
+    )
+    await asyncio.sleep(0.01)
+    mock_write.assert_not_called()
+
+    client._protocol.resume_writing()
+    result: Data = await task
+
+    mock_write.assert_called_once()
+    assert result.get("key_1")
+
+
 @pytest.mark.asyncio
 async def test_send_non_flush_command_with_falsy_data(
     client: Client,
@@ -157,3 +185,62 @@ async def test_send_non_flush_command_with_falsy_data(
         )
 
     assert str(exception.value) == msg
+
+
+@pytest.mark.asyncio
+async def test_stream_set(
+    mocker: MockerFixture,
+    client: Client,
+) -> None:
+    mocker.patch("kedung.client.STREAM_CHUNK_SIZE", 2)
+    mock_send = mocker.patch.object(
+        client,
+        "send",
+        AsyncMock(return_value={"key_1": True}),
+    )
+
+    result = await client.stream_set("key_1", ["abc", "de"])
+
+    sent = [call.args[1]["key_1"] for call in mock_send.mock_calls]
+    assert result
+    assert sent == [
+        {"chunk": "ab", "offset": 0, "end": False},
+        {"chunk": "c", "offset": 2, "end": False},
+        {"chunk": "de", "offset": 3, "end": True},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_get(
+    mocker: MockerFixture,
+    client: Client,
+) -> None:
+    mocker.patch.object(
+        client,
+        "send",
+        AsyncMock(
+            side_effect=[
+                {"key_1": {"chunk": "abc", "end": False, "length": 5}},
+                {"key_1": {"chunk": "de", "end": True, "length": 5}},
+            ],
+        ),
+    )
+
+    result = [chunk async for chunk in client.stream_get("key_1", 3)]
+
+    assert result == ["abc", "de"]
+
+
+@pytest.mark.asyncio
+async def test_stream_get_with_error(
+    mocker: MockerFixture,
+    client: Client,
+) -> None:
+    mocker.patch.object(
+        client,
+        "send",
+        AsyncMock(return_value={"errors": ["Value dari key `key_1` bukan string!"]}),
+    )
+
+    with pytest.raises(CommandError):
+        _ = [chunk async for chunk in client.stream_get("key_1")]
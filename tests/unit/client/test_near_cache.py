@@ -0,0 +1,148 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from kedung.client import Client
+from kedung.client._near_cache import NearCache
+from kedung.client._protocol import ClientBufferedProtocol
+from pytest_mock.plugin import MockerFixture
+
+if TYPE_CHECKING:
+    from kedung.utils.custom_types import Data
+
+
+@pytest.fixture
+def near_cache() -> NearCache:
+    return NearCache(max_size=2, ttl=60)
+
+
+def test_get_and_store(near_cache: NearCache) -> None:
+    assert near_cache.get("key_1") == (None, False)
+
+    near_cache.store("key_1", "value_1", near_cache.begin_read())
+    near_cache.end_read()
+
+    assert near_cache.get("key_1") == ("value_1", True)
+    assert near_cache.stats["hits"] == 1
+    assert near_cache.stats["misses"] == 1
+
+
+def test_store_evicts_least_recently_used(near_cache: NearCache) -> None:
+    for key in ("key_1", "key_2"):
+        near_cache.store(key, key, 0)
+    near_cache.get("key_1")
+    near_cache.store("key_3", "key_3", 0)
+
+    assert "key_1" in near_cache
+    assert "key_2" not in near_cache
+    assert len(near_cache) == 2  # noqa: PLR2004
+
+
+def test_store_skips_value_invalidated_in_flight(near_cache: NearCache) -> None:
+    version = near_cache.begin_read()
+    # pesan invalidasi datang sebelum jawaban `GET`.
+    near_cache.invalidate(["key_1"])
+    near_cache.store("key_1", "stale", version)
+    near_cache.store("key_2", "value_2", version)
+    near_cache.end_read()
+
+    assert "key_1" not in near_cache
+    assert "key_2" in near_cache
+
+
+def test_invalidate_all(near_cache: NearCache) -> None:
+    near_cache.store("key_1", "value_1", 0)
+    version = near_cache.begin_read()
+    near_cache.invalidate_all()
+    near_cache.store("key_2", "stale", version)
+    near_cache.end_read()
+
+    assert len(near_cache) == 0
+
+
+def test_expired_entry(mocker: MockerFixture) -> None:
+    near_cache = NearCache(ttl=10)
+    mock_monotonic = mocker.patch("kedung.client._near_cache.time.monotonic")
+    mock_monotonic.return_value = 100.0
+    near_cache.store("key_1", "value_1", 0)
+
+    mock_monotonic.return_value = 111.0
+
+    assert near_cache.get("key_1") == (None, False)
+
+
+class TestClientWithNearCache:
+    @pytest.fixture
+    def client(self, mocker: MockerFixture, near_cache: NearCache) -> Client:
+        client = Client(near_cache=near_cache)
+        client._protocol = ClientBufferedProtocol()
+        client._transport = mocker.Mock(spec=asyncio.Transport)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_get_served_from_near_cache(
+        self,
+        mocker: MockerFixture,
+        client: Client,
+    ) -> None:
+        responses: list[Data] = [{"on": True}, {"key_1": "value_1"}]
+        mock_send = mocker.patch.object(client, "_send", side_effect=responses)
+
+        first = await client.send("GET", {"key_1": None})
+        second = await client.send("GET", {"key_1": None})
+
+        assert first == second == {"key_1": "value_1"}
+        # `TRACKING` lalu `GET`, pembacaan kedua tidak ke server.
+        assert [call.args[0] for call in mock_send.call_args_list] == [
+            "TRACKING",
+            "GET",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bget_fetches_only_missing_keys(
+        self,
+        mocker: MockerFixture,
+        client: Client,
+        near_cache: NearCache,
+    ) -> None:
+        near_cache.store("key_1", "value_1", 0)
+        client._tracked_protocol = client._protocol
+        mock_send = mocker.patch.object(
+            client,
+            "_send",
+            return_value={"key_2": "value_2"},
+        )
+
+        result = await client.send("BGET", {"key_2": None, "key_1": None})
+
+        assert list(result.items()) == [("key_2", "value_2"), ("key_1", "value_1")]
+        mock_send.assert_called_once_with("BGET", {"key_2": None})
+
+    @pytest.mark.asyncio
+    async def test_mutation_invalidates_near_cache(
+        self,
+        mocker: MockerFixture,
+        client: Client,
+        near_cache: NearCache,
+    ) -> None:
+        near_cache.store("key_1", "value_1", 0)
+        mocker.patch.object(client, "_send", return_value={"key_1": True})
+
+        await client.send("SET", {"key_1": "value_2"})
+
+        assert "key_1" not in near_cache
+
+    def test_push_invalidates_near_cache(
+        self,
+        client: Client,
+        near_cache: NearCache,
+    ) -> None:
+        near_cache.store("key_1", "value_1", 0)
+        near_cache.store("key_2", "value_2", 0)
+
+        client._handle_push({"push": "invalidate", "keys": ["key_1"]})
+        assert "key_1" not in near_cache
+        assert "key_2" in near_cache
+
+        client._handle_push({"push": "invalidate", "keys": None})
+        assert len(near_cache) == 0
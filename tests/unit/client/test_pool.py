@@ -0,0 +1,128 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from kedung.client import ClientPool, _PooledConnection
+from kedung.client._protocol import ClientBufferedProtocol
+from pytest_mock.plugin import MockerFixture
+
+
+def _connection(mocker: MockerFixture) -> _PooledConnection:
+    transport = mocker.Mock(spec=asyncio.Transport)
+    transport.is_closing.return_value = False
+    return _PooledConnection(transport, ClientBufferedProtocol())
+
+
+@pytest.fixture
+def pool(mocker: MockerFixture) -> ClientPool:
+    pool = ClientPool(size=3, max_in_flight=2, health_check_interval=60)
+    mocker.patch.object(
+        pool,
+        "_open_connection",
+        AsyncMock(side_effect=lambda: _connection(mocker)),
+    )
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_create_connection(pool: ClientPool) -> None:
+    await pool.create_connection()
+
+    assert pool.stats["size"] == 3  # noqa: PLR2004
+    assert pool.stats["alive"] == 3  # noqa: PLR2004
+
+    pool.close_connection()
+    assert pool.stats["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_send_uses_least_busy_connection(
+    mocker: MockerFixture,
+    pool: ClientPool,
+) -> None:
+    await pool.create_connection()
+    pool._connections[0].in_flight = 2
+    pool._connections[1].in_flight = 1
+    mocker.patch.object(
+        pool,
+        "_get_injected_data",
+        return_value=({"key_1": True}, True),
+    )
+
+    result = await pool.send("GET", {"key_1": None})
+
+    assert result.get("key_1")
+    pool._connections[2].transport.write.assert_called_once()  # type: ignore[attr-defined]
+    assert pool._connections[2].in_flight == 0
+    assert pool.stats["requests"] == 1
+    pool.close_connection()
+
+
+@pytest.mark.asyncio
+async def test_send_waits_when_pool_is_saturated(
+    mocker: MockerFixture,
+) -> None:
+    pool = ClientPool(size=1, max_in_flight=1, health_check_interval=60)
+    mocker.patch.object(
+        pool,
+        "_open_connection",
+        AsyncMock(side_effect=lambda: _connection(mocker)),
+    )
+    await pool.create_connection()
+    responses: dict[str, bool] = {}
+    mocker.patch.object(
+        pool,
+        "_get_injected_data",
+        side_effect=lambda _: (({"key_1": True}, True) if responses else (None, False)),
+    )
+
+    first = asyncio.create_task(pool.send("GET", {"key_1": None}))
+    second = asyncio.create_task(pool.send("GET", {"key_1": None}))
+    await asyncio.sleep(0.02)
+    responses["ready"] = True
+    await asyncio.gather(first, second)
+
+    assert pool.stats["wait_time_max"] > 0
+    pool.close_connection()
+
+
+@pytest.mark.asyncio
+async def test_send_without_alive_connection(pool: ClientPool) -> None:
+    await pool.create_connection()
+    for connection in pool._connections:
+        connection.transport.is_closing.return_value = True  # type: ignore[attr-defined]
+
+    with pytest.raises(ConnectionError):
+        await pool.send("GET", {"key_1": None})
+
+    pool.close_connection()
+
+
+@pytest.mark.asyncio
+async def test_health_check_replaces_dead_connection(pool: ClientPool) -> None:
+    await pool.create_connection()
+    dead = pool._connections[0]
+    dead.transport.is_closing.return_value = True  # type: ignore[attr-defined]
+
+    await pool._check_idle_connections()
+
+    assert pool._connections[0] is not dead
+    assert pool.stats["reconnects"] == 1
+    pool.close_connection()
+
+
+@pytest.mark.asyncio
+async def test_health_check_pings_idle_connection(
+    mocker: MockerFixture,
+    pool: ClientPool,
+) -> None:
+    await pool.create_connection()
+    for connection in pool._connections:
+        connection.last_used -= 120
+    mock_ping = mocker.patch.object(pool, "_ping", AsyncMock(return_value=True))
+
+    await pool._check_idle_connections()
+
+    assert mock_ping.await_count == 3  # noqa: PLR2004
+    assert pool.stats["reconnects"] == 0
+    pool.close_connection()
@@ -1,6 +1,8 @@
+import json
+
 import pytest
 from kedung.client._protocol import ClientBufferedProtocol
-from kedung.utils.common_tasks import allocate_data_length
+from kedung.utils.common_tasks import PUSH_MARKER, allocate_data_length
 from pytest_mock.plugin import MockerFixture
 
 
@@ -64,3 +66,22 @@ def test_buffer_updated(
     protocol.buffer_updated(size_hint)
 
     assert bool(protocol.tmp_storage._bucket)
+
+
+def test_buffer_updated_dispatches_push_frame(
+    mocker: MockerFixture,
+    protocol: ClientBufferedProtocol,
+) -> None:
+    handler = mocker.Mock()
+    protocol.push_handlers.append(handler)
+    message = {"push": "invalidate", "keys": ["key_1"]}
+    raw_data = allocate_data_length(
+        json.dumps({**message, "injected_data": PUSH_MARKER}),
+    )
+    size_hint = len(raw_data)
+    protocol.buffer = bytearray(raw_data + protocol.buffer[size_hint:])
+
+    protocol.buffer_updated(size_hint)
+
+    handler.assert_called_once_with(message)
+    assert PUSH_MARKER not in protocol.tmp_storage._bucket
@@ -0,0 +1,113 @@
+import json
+import socket
+import threading
+from collections.abc import Generator
+
+import pytest
+from kedung.client._sync import SyncClient, SyncClientPool
+from kedung.utils.common_tasks import allocate_data_length
+from kedung.utils.exceptions import MissingComponentError
+from pytest_mock.plugin import MockerFixture
+
+
+@pytest.fixture
+def connected_client() -> Generator[tuple[SyncClient, socket.socket]]:
+    """`SyncClient` yg terhubung ke salah satu ujung `socketpair`."""
+    client = SyncClient()
+    client_sock, server_sock = socket.socketpair()
+    client._sock = client_sock
+    client._reader = client_sock.makefile("rb")
+
+    yield client, server_sock
+
+    client.close()
+    server_sock.close()
+
+
+def _respond(server_sock: socket.socket, *responses: dict[str, object]) -> None:
+    server_sock.sendall(
+        b"".join(allocate_data_length(json.dumps(data)) for data in responses),
+    )
+
+
+def test_send(
+    mocker: MockerFixture,
+    connected_client: tuple[SyncClient, socket.socket],
+) -> None:
+    client, server_sock = connected_client
+    mocker.patch(
+        "kedung.client._helper.create_unique_key",
+        return_value="GET_00000001",
+    )
+    _respond(server_sock, {"key_1": "value_1", "injected_data": "GET_00000001"})
+
+    result = client.send("GET", {"key_1": None})
+
+    assert result == {"key_1": "value_1"}
+    sent = server_sock.recv(1024)
+    assert b'"command": "GET"' in sent
+
+
+def test_pipeline_keeps_request_order(
+    mocker: MockerFixture,
+    connected_client: tuple[SyncClient, socket.socket],
+) -> None:
+    client, server_sock = connected_client
+    mocker.patch(
+        "kedung.client._helper.create_unique_key",
+        side_effect=["SET_00000001", "GET_00000002"],
+    )
+    # jawaban sengaja dikirim dengan urutan terbalik.
+    _respond(
+        server_sock,
+        {"key_1": "value_1", "injected_data": "GET_00000002"},
+        {"key_1": True, "injected_data": "SET_00000001"},
+    )
+
+    result = client.pipeline(
+        [("SET", {"key_1": "value_1"}), ("GET", {"key_1": None})],
+    )
+
+    assert result == [{"key_1": True}, {"key_1": "value_1"}]
+
+
+def test_pipeline_with_lost_connection(
+    connected_client: tuple[SyncClient, socket.socket],
+) -> None:
+    client, server_sock = connected_client
+    server_sock.close()
+
+    with pytest.raises(ConnectionError):
+        client.send("GET", {"key_1": None})
+
+    assert not client.is_connected
+
+
+def test_send_non_flush_command_with_falsy_data() -> None:
+    with pytest.raises(MissingComponentError):
+        SyncClient().send("GET", {})
+
+
+def test_pool_reuses_connections(mocker: MockerFixture) -> None:
+    mocker.patch.object(SyncClient, "connect")
+    mock_pipeline = mocker.patch.object(
+        SyncClient,
+        "pipeline",
+        return_value=[{"key_1": True}],
+    )
+    pool = SyncClientPool(size=2)
+
+    threads = [
+        threading.Thread(target=pool.send, args=("GET", {"key_1": None}))
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert mock_pipeline.call_count == 10  # noqa: PLR2004
+    assert pool._created <= 2  # noqa: PLR2004
+
+    pool.close()
+    assert pool._created == 0
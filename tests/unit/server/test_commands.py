@@ -1,6 +1,11 @@
 import pytest
 from kedung.server._commands import Command
+from kedung.server._metrics import ServerMetrics
+from kedung.server._storage import DataHolder
+from kedung.server._tracking import InvalidationTracker
 from kedung.utils.custom_types import Data, DataValue
+from kedung.utils.exceptions import CommandError
+from pytest_mock.plugin import MockerFixture
 
 DummyData = dict[str, str | dict[str, str]]
 
@@ -222,3 +227,105 @@ def test_flush(command: Command) -> None:
 
     result: Data = command.flush_(inject_injected_data(dummy))
     assert all(result.values())
+
+
+def test_stats(command: Command) -> None:
+    ServerMetrics.reset()
+    ServerMetrics.increment("write_paused")
+    dummy: Data = {
+        "command": "STATS",
+        "data": {"injected_data": "dummy_injected_1"},
+    }
+
+    result: Data = command.stats(dummy)
+
+    assert result.get("write_paused") == 1
+    assert "keys" in result
+    assert result.get("injected_data") == "dummy_injected_1"
+
+
+class TestStreamOperations:
+    @pytest.fixture(autouse=True)
+    def clean_storage(self) -> None:
+        DataHolder.clear_all()
+
+    def _sset(self, key: str, chunk: str, offset: int, *, end: bool) -> Data:
+        return {
+            "command": "SSET",
+            "data": {
+                key: {"chunk": chunk, "offset": offset, "end": end},
+                "injected_data": "dummy_injected_1",
+            },
+        }
+
+    def _sget(self, key: str, offset: int, size: int) -> Data:
+        return {
+            "command": "SGET",
+            "data": {
+                key: {"offset": offset, "size": size},
+                "injected_data": "dummy_injected_1",
+            },
+        }
+
+    def test_stream_set_joins_chunks(self, command: Command) -> None:
+        assert command.stream_set(self._sset("key_1", "abc", 0, end=False))["key_1"]
+        assert command.stream_set(self._sset("key_1", "de", 3, end=True))["key_1"]
+
+        assert DataHolder.get("key_1") == {"key_1": "abcde"}
+        assert not command._streams
+
+    def test_stream_set_with_wrong_offset(self, command: Command) -> None:
+        command.stream_set(self._sset("key_1", "abc", 0, end=False))
+
+        with pytest.raises(CommandError):
+            command.stream_set(self._sset("key_1", "de", 1, end=True))
+
+        assert "key_1" not in command._streams
+
+    def test_stream_set_existing_key(self, command: Command) -> None:
+        DataHolder.set_("key_1", "value_1")
+
+        result = command.stream_set(self._sset("key_1", "abc", 0, end=False))
+
+        assert result["key_1"] is False
+
+    def test_stream_get_in_chunks(self, command: Command) -> None:
+        DataHolder.set_("key_1", "abcde")
+
+        first = command.stream_get(self._sget("key_1", 0, 3))
+        second = command.stream_get(self._sget("key_1", 3, 3))
+
+        assert first["key_1"] == {"chunk": "abc", "end": False, "length": 5}
+        assert second["key_1"] == {"chunk": "de", "end": True, "length": 5}
+
+    def test_stream_get_non_existent_key(self, command: Command) -> None:
+        result = command.stream_get(self._sget("key_1", 0, 3))
+
+        assert result["key_1"] is None
+
+    def test_stream_get_non_string_value(self, command: Command) -> None:
+        DataHolder.set_("key_1", [1, 2, 3])
+
+        with pytest.raises(CommandError):
+            command.stream_get(self._sget("key_1", 0, 3))
+
+
+def test_tracking(mocker: MockerFixture) -> None:
+    connection = mocker.Mock()
+    command = Command(connection)
+    dummy: Data = {
+        "command": "TRACKING",
+        "data": {"on": True, "injected_data": "dummy_injected_1"},
+    }
+
+    result: Data = command.tracking(dummy)
+    command.track_reads("GET", ["key_1"])
+    command.track_reads("SET", ["key_2"])
+
+    assert result.get("tracking") is True
+    assert InvalidationTracker.tracked_keys(connection) == {"key_1"}
+
+    dummy["data"] = {"on": False, "injected_data": "dummy_injected_2"}
+    command.tracking(dummy)
+
+    assert not InvalidationTracker.tracked_keys(connection)
@@ -1,9 +1,16 @@
+import asyncio
 from json import dumps, loads
 from unittest.mock import MagicMock
 
 import pytest
+from kedung.server._metrics import ServerMetrics
 from kedung.server._protocol import ServerBufferedProtocol
-from kedung.utils.common_tasks import allocate_data_length
+from kedung.server._storage import DataHolder
+from kedung.utils.common_tasks import (
+    PREALLOCATE_SPACE,
+    PUSH_MARKER,
+    allocate_data_length,
+)
 from kedung.utils.custom_types import Data
 from kedung.utils.exceptions import CommandError
 from pytest_mock.plugin import MockerFixture
@@ -59,6 +66,53 @@ def test_connection_close(
     assert protocol.transport.is_closing()
 
 
+def test_connection_made_sets_write_buffer_limits(
+    mocker: MockerFixture,
+    protocol: ServerBufferedProtocol,
+) -> None:
+    mock_transport = mocker.Mock()
+    protocol.connection_made(mock_transport)
+
+    mock_transport.set_write_buffer_limits.assert_called_once()
+
+
+def test_pause_and_resume_writing(
+    mocker: MockerFixture,
+    protocol: ServerBufferedProtocol,
+) -> None:
+    ServerMetrics.reset()
+    mock_transport = mocker.Mock()
+    protocol.connection_made(mock_transport)
+
+    protocol.pause_writing()
+
+    mock_transport.pause_reading.assert_called_once()
+    assert ServerMetrics.get("write_paused") == 1
+    assert ServerMetrics.get("paused_connections") == 1
+
+    protocol.resume_writing()
+
+    mock_transport.resume_reading.assert_called_once()
+    assert ServerMetrics.get("paused_connections") == 0
+
+
+def test_output_buffer_limit_disconnects_client(
+    mocker: MockerFixture,
+    protocol: ServerBufferedProtocol,
+) -> None:
+    ServerMetrics.reset()
+    mocker.patch("kedung.server._protocol.OUTPUT_BUFFER_LIMIT", 10)
+    mock_transport = mocker.Mock()
+    mock_transport.get_write_buffer_size.return_value = 11
+    protocol.connection_made(mock_transport)
+    protocol.pause_writing()
+
+    protocol.buffer_updated(_pipelined_buffer(protocol, 1))
+
+    mock_transport.abort.assert_called_once()
+    assert ServerMetrics.get("output_limit_disconnects") == 1
+
+
 def test_get_buffer(protocol: ServerBufferedProtocol) -> None:
     buffer = protocol.get_buffer(8)
 
@@ -95,8 +149,8 @@ def test_buffer_updated(
         protocol,
     )
 
-    result.write.assert_called_with(
-        b'0000050{"key_1": true, "injected_data": "injected_value"}',
+    result.writelines.assert_called_with(
+        [b'0000050{"key_1": true, "injected_data": "injected_value"}'],
     )
 
 
@@ -111,9 +165,11 @@ def test_buffer_updated_with_invalid_command(
         protocol,
     )
 
-    result.write.assert_called_with(
-        b'0000082{"errors": ["Perintah `XSET` tidak dikenali!"],'
-        b' "injected_data": "injected_value"}',
+    result.writelines.assert_called_with(
+        [
+            b'0000082{"errors": ["Perintah `XSET` tidak dikenali!"],'
+            b' "injected_data": "injected_value"}',
+        ],
     )
 
 
@@ -128,10 +184,95 @@ def test_buffer_updated_wo_command(
         protocol,
     )
 
-    result.write.assert_called_with(
-        b'0000087{"errors": ["Tidak dapat menemukan key `command`!"],'
-        b' "injected_data": "injected_value"}',
+    result.writelines.assert_called_with(
+        [
+            b'0000087{"errors": ["Tidak dapat menemukan key `command`!"],'
+            b' "injected_data": "injected_value"}',
+        ],
+    )
+
+
+def _pipelined_buffer(protocol: ServerBufferedProtocol, total: int) -> int:
+    raw_data = b"".join(
+        allocate_data_length(
+            dumps(
+                {
+                    "command": "EXIST",
+                    "data": {f"key_{number}": None, "injected_data": f"i_{number}"},
+                },
+            ),
+        )
+        for number in range(total)
     )
+    protocol.buffer = bytearray(raw_data + protocol.buffer[len(raw_data) :])
+    return len(raw_data)
+
+
+def test_buffer_updated_coalesces_pipelined_responses(
+    protocol: ServerBufferedProtocol,
+    mocker: MockerFixture,
+) -> None:
+    total = 50
+    mock_transport = mocker.MagicMock()
+    protocol.transport = mock_transport
+
+    protocol.buffer_updated(_pipelined_buffer(protocol, total))
+
+    mock_transport.write.assert_not_called()
+    mock_transport.writelines.assert_called_once()
+    assert len(mock_transport.writelines.call_args.args[0]) == total
+
+
+def test_buffer_updated_respects_write_batch_size(
+    protocol: ServerBufferedProtocol,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("kedung.server._protocol.WRITE_BATCH_SIZE", 20)
+    mock_transport = mocker.MagicMock()
+    protocol.transport = mock_transport
+
+    protocol.buffer_updated(_pipelined_buffer(protocol, 50))
+
+    batches = [len(call.args[0]) for call in mock_transport.writelines.mock_calls]
+    assert batches == [20, 20, 10]
+
+
+@pytest.mark.asyncio
+async def test_buffer_updated_coalesces_per_loop_iteration(
+    protocol: ServerBufferedProtocol,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("kedung.server._protocol.WRITE_COALESCING", "loop")
+    mock_transport = mocker.MagicMock()
+    protocol.transport = mock_transport
+
+    total = 5
+    protocol.buffer_updated(_pipelined_buffer(protocol, total))
+    protocol.buffer_updated(_pipelined_buffer(protocol, total))
+    mock_transport.writelines.assert_not_called()
+
+    await asyncio.sleep(0)
+
+    mock_transport.writelines.assert_called_once()
+    assert len(mock_transport.writelines.call_args.args[0]) == total * 2
+
+
+def test_buffer_updated_with_oversized_response(
+    protocol: ServerBufferedProtocol,
+    mocker: MockerFixture,
+    dummy_data: Data,
+) -> None:
+    mocker.patch.object(
+        protocol,
+        "_process_command",
+        return_value=dumps({"key_1": "x" * 10**7}),
+    )
+
+    result = _buffer_update_executor(dummy_data, mocker, protocol)
+
+    response = loads(result.writelines.call_args.args[0][0][7:])
+    assert response["errors"]
+    assert response["injected_data"] == "injected_value"
 
 
 def test_process_command(
@@ -162,3 +303,45 @@ def test_process_command_with_missing_key_command(
 
     msg = "Tidak dapat menemukan key `command`!"
     assert msg in str(missing_command_exc.value)
+
+
+def test_invalidate_sends_push_frame(
+    mocker: MockerFixture,
+    protocol: ServerBufferedProtocol,
+) -> None:
+    mock_transport = mocker.Mock()
+    mock_transport.is_closing.return_value = False
+    protocol.connection_made(mock_transport)
+
+    # di luar event loop, pesan invalidasi langsung dikirim.
+    protocol.invalidate(["key_2", "key_1"])
+
+    frames = mock_transport.writelines.call_args.args[0]
+    message = loads(frames[0][PREALLOCATE_SPACE:])
+    assert message == {
+        "push": "invalidate",
+        "keys": ["key_1", "key_2"],
+        "injected_data": PUSH_MARKER,
+    }
+
+
+def test_tracked_read_is_invalidated(
+    mocker: MockerFixture,
+    protocol: ServerBufferedProtocol,
+) -> None:
+    mock_transport = mocker.Mock()
+    mock_transport.is_closing.return_value = False
+    protocol.connection_made(mock_transport)
+    protocol.command.tracking_enabled = True
+    mock_invalidate = mocker.patch.object(protocol, "invalidate")
+    DataHolder.set_("key_1", "data_1")
+
+    protocol._process_command(
+        {"command": "GET", "data": {"key_1": None, "injected_data": "GET_1"}},
+    )
+    protocol._process_command(
+        {"command": "DEL", "data": {"key_1": None, "injected_data": "DEL_1"}},
+    )
+    protocol.connection_lost()
+
+    mock_invalidate.assert_called_once_with(("key_1",))
@@ -1,5 +1,7 @@
 import pytest
+from kedung.server._events import KeyspaceEvents
 from kedung.server._storage import DataHolder
+from pytest_mock.plugin import MockerFixture
 
 DummyData = list[tuple[str, dict[str, str]]]
 
@@ -51,3 +53,25 @@ def test_clear_all_data(holder: DataHolder, dummy_data: DummyData) -> None:
     holder.set_(dummy_data[0][0], dummy_data[0][1])
 
     assert holder.clear_all()
+
+
+def test_storage_emits_events(
+    mocker: MockerFixture,
+    holder: DataHolder,
+    dummy_data: DummyData,
+) -> None:
+    listener = mocker.Mock()
+    KeyspaceEvents.subscribe(listener)
+    key = dummy_data[0][0]
+
+    holder.set_(key, dummy_data[0][1])
+    holder.expire(key)
+    holder.clear_all()
+    KeyspaceEvents.unsubscribe(listener)
+
+    assert [call.args for call in listener.call_args_list] == [
+        ("set", key),
+        ("expired", key),
+        ("flush", ""),
+    ]
+    assert not holder.contains(key)
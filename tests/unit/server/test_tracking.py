@@ -0,0 +1,46 @@
+from collections.abc import Generator
+
+import pytest
+from kedung.server._events import KeyspaceEvents
+from kedung.server._tracking import InvalidationTracker
+from pytest_mock.plugin import MockerFixture
+
+
+@pytest.fixture(autouse=True)
+def _clean_tracker() -> Generator[None]:
+    yield
+    InvalidationTracker._readers.clear()
+    InvalidationTracker._keys.clear()
+
+
+def test_event_invalidates_once(mocker: MockerFixture) -> None:
+    target = mocker.Mock()
+    InvalidationTracker.track(["key_1", "key_2"], target)
+
+    KeyspaceEvents.emit("set", "key_1")
+    KeyspaceEvents.emit("del", "key_1")
+
+    target.invalidate.assert_called_once_with(("key_1",))
+    assert InvalidationTracker.tracked_keys(target) == {"key_2"}
+
+
+def test_flush_invalidates_all_targets(mocker: MockerFixture) -> None:
+    targets = [mocker.Mock(), mocker.Mock()]
+    for target in targets:
+        InvalidationTracker.track(["key_1"], target)
+
+    KeyspaceEvents.emit("flush")
+
+    for target in targets:
+        target.invalidate_all.assert_called_once_with()
+        assert not InvalidationTracker.tracked_keys(target)
+
+
+def test_forget(mocker: MockerFixture) -> None:
+    target = mocker.Mock()
+    InvalidationTracker.track(["key_1"], target)
+
+    InvalidationTracker.forget(target)
+    KeyspaceEvents.emit("expired", "key_1")
+
+    target.invalidate.assert_not_called()
@@ -3,6 +3,7 @@ from json import dumps, loads
 
 import pytest
 from kedung.utils.common_tasks import allocate_data_length
+from kedung.utils.exceptions import PrefixError
 from kedung.utils.unpacking import UnpackRawData
 from kedung.utils.userconf import get_preallocate_space
 
@@ -82,3 +83,8 @@ def test_unpacking_data_with_both_data_types(
         if isinstance(data, dict):
             assert data.get("broken_key_1") == "data_1"
             assert data.get("valid_key_1") == "data_1"
+
+
+def test_allocate_data_length_exceeding_prefix() -> None:
+    with pytest.raises(PrefixError):
+        allocate_data_length("x" * (10**PREALOCATE_SPACE))